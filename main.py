@@ -14,8 +14,8 @@ from civitai_manager.core.metadata_manager import (
     get_output_path
 )
 from data import ModelData
-from src.civitai_manager.utils.html_generators.browser_page import generate_global_summary
-from src.civitai_manager.utils.config import Config, load_config, ConfigValidationError
+from civitai_manager.utils.html_generators.browser_page import generate_global_summary
+from civitai_manager.utils.config import Config, load_config, ConfigValidationError
 from deepdiff import diff
 
 import argparse
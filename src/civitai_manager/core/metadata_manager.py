@@ -12,12 +12,12 @@ import pydantic
 
 import civitai
 from civitai_manager.utils.config import Config
-from data import HASH_SUFFIX, INFO_SUFFIX, MISSING_FILES_NAME, MODEL_VERSION_SUFFIX, HashData, ModelData
+from data import HASH_SHA256, HASH_SUFFIX, INFO_SUFFIX, MISSING_FILES_NAME, MODEL_VERSION_SUFFIX, HashData, ModelData, read_missing_models
 from file_types import CivitaiVersionFileTA, HashFileDataTA, StoredFile
 
 from ..utils.file_tracker import ProcessedFilesManager
 from ..utils.string_utils import sanitize_filename
-from ..utils.html_generators.model_page import generate_html_summary
+from ..utils.html_generators.model_page import generate_html_summaries, generate_html_summary
 
 import aiohttp
 
@@ -181,7 +181,7 @@ def write_hash_file(output_dir: Path, safetensors_file: Path, hash_value: str):
     
     # Create hash JSON object
     hash_data = HashFileDataTA.validate_python({
-        "hash_type": "SHA256",
+        "hash_type": HASH_SHA256,
         "hash_value": hash_value,
         "filename": safetensors_file.name,
         "timestamp": datetime.now().isoformat()
@@ -271,8 +271,7 @@ def generate_image_json_files(base_output_path: Path):
     for version_file in version_files:
         try:
             # Read version data
-            with open(version_file, 'r', encoding='utf-8') as f:
-                version_data = civitai.ModelVersionResponseData.model_validate_json(f.read())
+            version_data = civitai.ModelVersionResponseData.model_validate_json(version_file.read_bytes())
             
             # Get model directory
             model_dir = version_file.parent
@@ -369,31 +368,30 @@ def find_duplicate_models(directory_path: Path, base_output_path: Path):
             continue
             
         try:
-            with open(hash_file, 'r', encoding='utf-8') as f:
-                hash_data = HashFileDataTA.validate_json(f.read())
-                hash_value: str = hash_data.get('hash_value')
-                if not hash_value:
-                    continue
-                    
-                # Find corresponding safetensors file
-                safetensors_file = None
-                for file in Path(directory_path).glob('**/*.safetensors'):
-                    if file.stem == model_dir.name:
-                        safetensors_file = file
-                        break
+            hash_data = HashFileDataTA.validate_json(hash_file.read_bytes())
+            hash_value: str = hash_data.get('hash_value')
+            if not hash_value:
+                continue
+
+            # Find corresponding safetensors file
+            safetensors_file = None
+            for file in Path(directory_path).glob('**/*.safetensors'):
+                if file.stem == model_dir.name:
+                    safetensors_file = file
+                    break
+            
+            if not safetensors_file:
+                continue
                 
-                if not safetensors_file:
-                    continue
-                    
-                if hash_value not in hash_map:
-                    hash_map[hash_value] = []
-                    
-                hash_map[hash_value].append({
-                    'model_dir': model_dir,
-                    'safetensors_file': safetensors_file,
-                    'processed_time': hash_data.get('timestamp')
-                })
+            if hash_value not in hash_map:
+                hash_map[hash_value] = []
                 
+            hash_map[hash_value].append({
+                'model_dir': model_dir,
+                'safetensors_file': safetensors_file,
+                'processed_time': hash_data.get('timestamp')
+            })
+            
         except Exception as e:
             raise Exception(f"Error reading hash file {hash_file}: {e}") from e
             continue
@@ -635,11 +633,10 @@ async def check_for_updates(safetensors_path: Path, output_dir: Path, hash_value
             
         # Read existing version data
         try:
-            with open(civitai_version_file, 'r', encoding='utf-8') as f:
-                existing_data = CivitaiVersionFileTA.validate_json(f.read())
-                existing_updated_at = existing_data.get('updatedAt')
-                if not existing_updated_at:
-                    return True
+            existing_data = CivitaiVersionFileTA.validate_json(civitai_version_file.read_bytes())
+            existing_updated_at = existing_data.get('updatedAt')
+            if not existing_updated_at:
+                return True
         except (json.JSONDecodeError, KeyError) as e:
             raise Exception(f"Error reading existing version data from {civitai_version_file}") from e
             return True
@@ -731,11 +728,10 @@ async def process_single_file(config: Config, model: ModelData):
             
         # Read existing hash
         try:
-            with open(hash_file, 'r') as f:
-                hash_data = HashFileDataTA.validate_json(f.read())
-                hash_value = hash_data.get('hash_value')
-                if not hash_value:
-                    raise ValueError("Invalid hash file")
+            hash_data = HashFileDataTA.validate_json(hash_file.read_bytes())
+            hash_value = hash_data.get('hash_value')
+            if not hash_value:
+                raise ValueError("Invalid hash file")
         except Exception as e:
             print(f"Error reading hash file: {e}")
             return False
@@ -792,14 +788,7 @@ async def process_directory(config: Config, directory_path: Path):
         
         if config.skipmissing:
             # Read missing models file
-            missing_file = Path(config.output) / 'missing_from_civitai.txt'
-            missing_models = set[str]()
-            if missing_file.exists():
-                with open(missing_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.strip() and not line.startswith('#'):
-                            filename = line.strip().split(' | ')[-1]
-                            missing_models.add(filename)
+            missing_models = read_missing_models(config.output / MISSING_FILES_NAME)
                             
             # Filter out previously missing models
             safetensors_files = [
@@ -816,7 +805,7 @@ async def process_directory(config: Config, directory_path: Path):
         safetensors_files: list[Path] = []
         all_files = list(directory_path.glob('**/*.safetensors'))
         for file_path in all_files:
-            hash_file = Path(config.output) / file_path.stem / f"{file_path.stem}_hash.json"
+            hash_file = config.output / file_path.stem / f"{file_path.stem}{HASH_SUFFIX}"
             if hash_file.exists():
                 safetensors_files.append(file_path)
         print(f"\nFound {len(safetensors_files)} previously processed files")
@@ -829,11 +818,23 @@ async def process_directory(config: Config, directory_path: Path):
     
     if config.onlyhtml:
         print("HTML only mode: Skipping data fetching")
+        # Nothing is fetched, so the pages are independent and rendered in parallel
+        models: list[ModelData] = []
+        for file_path in safetensors_files:
+            model = ModelData.from_trusted(config.output, file_path)
+            missing = [f for f in model.required_paths if not f.exists()]
+            if missing:
+                print(f"Error: Missing required JSON files for {file_path.name}: {missing}")
+                continue
+            models.append(model)
+        results = generate_html_summaries(config, models, VERSION)
+        print(f"\nGenerated {results.count('generated')} of {len(safetensors_files)} HTML summaries, {results.count('up_to_date')} already up to date")
+        return True
     
     files_processed = 0
     for i, file_path in enumerate(safetensors_files, 1):
         print(f"\n[{i}/{len(safetensors_files)}] Processing: {file_path.relative_to(directory_path)}")
-        success = await process_single_file(config, ModelData(base_dir=config.output, safetensors=file_path))
+        success = await process_single_file(config, ModelData.from_trusted(config.output, file_path))
         
         if success:
             files_processed += 1
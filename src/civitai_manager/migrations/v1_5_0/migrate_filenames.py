@@ -1,6 +1,8 @@
+from collections.abc import Iterator
 from pathlib import Path
 import argparse
 import json
+import os
 from src.civitai_manager.utils.string_utils import sanitize_filename
 
 def update_processed_files(output_dir: Path, dry_run: bool = True):
@@ -49,6 +51,21 @@ def update_processed_files(output_dir: Path, dry_run: bool = True):
     except Exception as e:
         print(f"Error updating processed_files.json: {e}")
 
+def find_safetensors(root: Path) -> Iterator[Path]:
+    """
+    Recursively yield all .safetensors files below a directory
+
+    Args:
+        root (Path): Directory to search
+
+    Returns:
+        Iterator[Path]: Paths of the .safetensors files found
+    """
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            if filename.endswith('.safetensors'):
+                yield Path(dirpath) / filename
+
 def migrate_model_files(input_dir: Path, output_dir: Path, dry_run: bool = True):
     """
     Migrate model files to use sanitized filenames
@@ -64,7 +81,7 @@ def migrate_model_files(input_dir: Path, output_dir: Path, dry_run: bool = True)
         print("\nDRY RUN MODE - No files will be modified")
     
     # Get all safetensors files
-    safetensors_files = list(input_dir.glob('**/*.safetensors'))
+    safetensors_files = list(find_safetensors(input_dir))
     
     for safetensors_file in safetensors_files:
         base_name = safetensors_file.stem
@@ -134,11 +151,11 @@ def migrate_model_files(input_dir: Path, output_dir: Path, dry_run: bool = True)
             
             preview_index += 1
         
-        # Add core files that exist
+        # Add core files that exist (one directory listing instead of a stat per file)
+        existing = {entry.name for entry in os.scandir(model_dir)}
         for file in core_files:
-            file_path = model_dir / file
-            if file_path.exists():
-                new_name = file.replace(base_name, sanitized_name)
+            if file in existing:
+                new_name = file.replace(base_name, sanitized_name, 1)
                 files_to_rename.append((file, new_name))
         
         # Rename directory first
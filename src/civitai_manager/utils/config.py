@@ -29,13 +29,14 @@ class ConfigValidationError(Exception):
 def validate_config(config: dict[str, object]) -> Config:
     """Validates the configuration and returns a normalized config dict."""
     # Required: either single or all path
-    if not ('single' in config) ^ ('all' in config):  # XOR - exactly one must be present
+    has_single, has_all = 'single' in config, 'all' in config
+    if has_single == has_all:  # exactly one must be present
         raise ConfigValidationError("Config must specify either 'single' or 'all' path, but not both")
     
     # Convert paths to strings if they're not already
-    if 'single' in config:
+    if has_single:
         config['single'] = str(config['single'])
-    if 'all' in config:
+    if has_all:
         config['all'] = str(config['all'])
     if 'output' in config:
         config['output'] = str(config['output'])
@@ -63,7 +64,7 @@ def validate_config(config: dict[str, object]) -> Config:
         raise ConfigValidationError("Cannot use both 'onlyupdate' and 'onlyhtml' at the same time")
     
     if config.get('clean', False):
-        if 'single' in config:
+        if has_single:
             raise ConfigValidationError("'clean' option can only be used with 'all'")
         if any(config.get(opt, False) for opt in ['onlyhtml', 'onlyupdate', 'onlynew']):
             raise ConfigValidationError("'clean' cannot be used with 'onlyhtml', 'onlyupdate', or 'onlynew'")
@@ -93,8 +94,7 @@ def load_config(config_path: str | Path | None = None) -> Config | None:
         return None
 
     try:
-        with open(config_path, 'r') as f:
-            config = ConfigTA.validate_json(f.read())
+        config = ConfigTA.validate_json(config_path.read_bytes())
         return config
     except json.JSONDecodeError as e:
         raise ConfigValidationError(f"Invalid JSON in config file: {str(e)}")
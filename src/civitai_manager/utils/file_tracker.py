@@ -1,7 +1,7 @@
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Self, TypedDict
-import pydantic
 
 from civitai_manager.utils.string_utils import AnyPathLike, pathlike_or_path_to_path
 from file_types import ProcessedFilesTA
@@ -27,15 +27,16 @@ class ProcessedFilesManager:
     def _load_processed_files(self: Self):
         """Load the list of processed files from JSON"""
         if self.processed_file.exists():
-            with open(self.processed_file, 'r') as f:
-                return pydantic.TypeAdapter(ProcessedFiles).validate_json(f.read())
+            return ProcessedFilesTA.validate_json(self.processed_file.read_bytes())
         return ProcessedFiles(files=[], last_update=None)
 
     def save_processed_files(self):
-        """Save the current list of processed files"""
-        with open(self.processed_file, 'w') as f:
-            self.processed_files['last_update'] = datetime.now()
-            _ = f.buffer.write(ProcessedFilesTA.dump_json(self.processed_files))
+        """Save the current list of processed files (atomically, via a temp file)"""
+        self.processed_files['last_update'] = datetime.now()
+        tmp_file = self.processed_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            _ = f.write(ProcessedFilesTA.dump_json(self.processed_files))
+        os.replace(tmp_file, self.processed_file)
 
     def is_file_processed(self, file_path: AnyPathLike):
         """Check if a file has been processed before"""
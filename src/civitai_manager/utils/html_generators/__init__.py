@@ -1,2 +1,3 @@
 from .model_page import generate_html_summary as generate_html_summary
+from .model_page import generate_html_summaries as generate_html_summaries
 from .browser_page import generate_global_summary as generate_global_summary
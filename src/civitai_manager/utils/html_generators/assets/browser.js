@@ -0,0 +1,140 @@
+// Search box
+const searchBox = document.getElementById('searchBox');
+const modelCards = document.querySelectorAll('.model-card');
+const sortSelect = document.getElementById('sortSelect');
+
+function sortCards() {
+    const [sortKey, sortDir] = sortSelect.value.split('-');
+    const sections = document.querySelectorAll('.type-section');
+
+    sections.forEach(section => {
+        const cards = Array.from(section.querySelectorAll('.model-card:not(.hidden)'));
+
+        cards.sort((a, b) => {
+            let aVal, bVal;
+
+            switch(sortKey) {
+                case 'date':
+                    aVal = a.dataset.addedDate || '';
+                    bVal = b.dataset.addedDate || '';
+                    break;
+                case 'downloads':
+                    aVal = parseInt(a.dataset.downloads) || 0;
+                    bVal = parseInt(b.dataset.downloads) || 0;
+                    break;
+                case 'name':
+                    aVal = a.dataset.name;
+                    bVal = b.dataset.name;
+                    break;
+                case 'creator':
+                    aVal = a.dataset.creator;
+                    bVal = b.dataset.creator;
+                    break;
+                case 'size':
+                    aVal = parseFloat(a.dataset.rawSize) || 0;
+                    bVal = parseFloat(b.dataset.rawSize) || 0;
+                    break;
+                default:
+                    return 0;
+            }
+
+            if (sortDir === 'asc') {
+                return aVal > bVal ? 1 : -1;
+            } else {
+                return aVal < bVal ? 1 : -1;
+            }
+        });
+
+        const grid = section.querySelector('.models-grid');
+        cards.forEach(card => grid.appendChild(card));
+    });
+}
+
+// Search index: one {name, filename, tags} entry per card, in document order
+const modelIndex = JSON.parse(document.getElementById('model-index').textContent);
+
+// Map each distinct tag to the cards carrying it, so a search term is checked
+// against every distinct tag once instead of once per card
+const cardsByTag = new Map();
+modelIndex.forEach((entry, i) => {
+    entry.tags.forEach(tag => {
+        if (!cardsByTag.has(tag)) {
+            cardsByTag.set(tag, new Set());
+        }
+        cardsByTag.get(tag).add(i);
+    });
+});
+
+function findMatchingCards(searchTerm) {
+    const matches = new Set();
+    // Check tags
+    cardsByTag.forEach((cardIds, tag) => {
+        if (tag.includes(searchTerm)) {
+            cardIds.forEach(id => matches.add(id));
+        }
+    });
+    // Check model name and filename
+    modelIndex.forEach((entry, i) => {
+        if (entry.name.includes(searchTerm) || entry.filename.includes(searchTerm)) {
+            matches.add(i);
+        }
+    });
+    return matches;
+}
+
+searchBox.addEventListener('input', function() {
+    const searchTerms = searchBox.value.toLowerCase().split(',').map(term => term.trim()).filter(term => term);
+
+    // Cards matching every term; null means no search is active
+    const visibleIds = searchTerms.length
+        ? searchTerms.map(findMatchingCards).reduce((acc, ids) => new Set([...acc].filter(id => ids.has(id))))
+        : null;
+
+    modelCards.forEach((card, i) => {
+        card.classList.toggle('hidden', visibleIds !== null && !visibleIds.has(i));
+    });
+
+    // Show/hide section headers based on visible cards
+    document.querySelectorAll('.type-section').forEach(section => {
+        const visibleCards = section.querySelectorAll('.model-card:not(.hidden)').length;
+        section.style.display = visibleCards > 0 ? 'block' : 'none';
+    });
+
+    // Re-sort visible cards
+    sortCards();
+});
+
+// Sort functionality
+sortSelect.addEventListener('change', sortCards);
+
+// Load saved sort preference
+const savedSort = localStorage.getItem('sortPreference') || 'date-desc';
+sortSelect.value = savedSort;
+
+// Initial sort
+sortCards();
+
+// Save sort preference when changed
+sortSelect.addEventListener('change', function() {
+    localStorage.setItem('sortPreference', this.value);
+    sortCards();
+});
+
+// Image covers toggle
+const toggleButton = document.getElementById('toggleCovers');
+const container = document.querySelector('.container');
+
+// Check local storage for user preference
+const showCovers = localStorage.getItem('showCovers') === 'true';
+if (showCovers) {
+    container.classList.add('show-covers');
+    toggleButton.classList.add('active');
+}
+
+toggleButton.addEventListener('click', function() {
+    container.classList.toggle('show-covers');
+    this.classList.toggle('active');
+
+    // Save preference to local storage
+    localStorage.setItem('showCovers', container.classList.contains('show-covers'));
+});
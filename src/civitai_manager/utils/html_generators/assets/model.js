@@ -0,0 +1,225 @@
+function openModal(mediaPath, isVideo, element, index) {
+    const modal = document.getElementById('imageModal');
+    const modalImg = document.getElementById('modalImage');
+    const modalVideo = document.getElementById('modalVideo');
+    const metadataDiv = document.getElementById('modalMetadata');
+    currentImageIndex = index;
+
+    modal.style.display = "block";
+
+    // Get metadata from clicked element
+    const metadata = element.dataset.metadata;
+
+    if (isVideo) {
+        modalImg.style.display = "none";
+        modalVideo.style.display = "block";
+        modalVideo.src = mediaPath;
+        modalVideo.play();
+    } else {
+        modalImg.style.display = "block";
+        modalVideo.style.display = "none";
+        modalImg.src = mediaPath;
+    }
+
+    // Display metadata if available
+    if (metadata) {
+        const data = JSON.parse(metadata);
+        let metadataHtml = '';
+
+        if (data.hasMeta === false) {
+            metadataHtml += `
+                <p>No metadata available</p>
+            `;
+        }
+
+        // Add generation metadata if available
+        if (data.meta) {
+            const meta = data.meta;
+
+            if (meta.prompt) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Prompt</div>
+                        <div class="metadata-value" style="white-space: pre-wrap;">${meta.prompt}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.cfgScale) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">CFG Scale/Guidance</div>
+                        <div class="metadata-value">${meta.cfgScale}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.steps) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Steps</div>
+                        <div class="metadata-value">${meta.steps}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.denoise) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Denoise</div>
+                        <div class="metadata-value">${meta.denoise}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.seed) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Seed</div>
+                        <div class="metadata-value">${meta.seed}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.sampler) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Sampler</div>
+                        <div class="metadata-value">${meta.sampler}</div>
+                    </div>
+                `;
+            }
+
+            if (meta['Schedule type']) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Schedule Type</div>
+                        <div class="metadata-value">${meta['Schedule type']}</div>
+                    </div>
+                `;
+            }
+
+            if (meta['Distilled CFG Scale']) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Distilled CFG Scale</div>
+                        <div class="metadata-value">${meta['Distilled CFG Scale']}</div>
+                    </div>
+                `;
+            }
+
+            if (meta.Model) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Model</div>
+                        <div class="metadata-value">${meta.Model}</div>
+                    </div>
+                `;
+            }
+
+            if (meta['resources'] && meta['resources'].length > 0) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Resources</div>
+                        <div class="metadata-value">
+                            ${meta['resources'].map(resource => `
+                                <div class="resource-item">
+                                    <div class="resource-name">${resource.name} (${resource.type})</div>
+                                    ${resource.weight ? `<div class="resource-weight">weight: ${resource.weight}</div>` : ''}
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                `;
+            }
+
+            if (meta['additionalResources'] && meta['additionalResources'].length > 0) {
+                metadataHtml += `
+                    <div class="metadata-section">
+                        <div class="metadata-label">Additional Resources</div>
+                        <div class="metadata-value">
+                            ${meta['additionalResources'].map(resource => `
+                                <div class="resource-item">
+                                    <div class="resource-name">${resource.name} (${resource.type})</div>
+                                    ${resource.strength ? `<div class="resource-weight">strength: ${resource.strength}</div>` : ''}
+                                </div>
+                            `).join('')}
+                        </div>
+                    </div>
+                `;
+            }
+        }
+
+        metadataDiv.innerHTML = metadataHtml;
+    } else {
+        metadataDiv.innerHTML = '<p>No metadata available</p>';
+    }
+}
+
+function closeModal() {
+    const modal = document.getElementById('imageModal');
+    const modalVideo = document.getElementById('modalVideo');
+    modal.style.display = "none";
+    modalVideo.pause();
+    modalVideo.currentTime = 0;
+}
+
+// Close modal
+document.addEventListener('DOMContentLoaded', function() {
+    // Close only when clicking the X button
+    document.querySelector('.modal-close').addEventListener('click', function() {
+        closeModal();
+    });
+
+    // Close with Escape key
+    document.addEventListener('keydown', function(event) {
+        if (event.key === "Escape") {
+            closeModal();
+        }
+    });
+});
+
+// Track current image index and all gallery items
+let currentImageIndex = 0;
+const galleryItems = document.querySelectorAll('.gallery-item');
+
+// Initialize gallery items array when DOM loads
+document.addEventListener('DOMContentLoaded', function() {
+    // Add keyboard navigation
+    document.addEventListener('keydown', function(event) {
+        const modal = document.getElementById('imageModal');
+        // Only handle keyboard navigation when modal is open
+        if (modal.style.display === "block") {
+            switch(event.key) {
+                case "ArrowLeft":
+                    navigateImage(-1);
+                    break;
+                case "ArrowRight":
+                    navigateImage(1);
+                    break;
+                case "Escape":
+                    closeModal();
+                    break;
+            }
+        }
+    });
+});
+
+// Function to navigate between images
+function navigateImage(direction) {
+    const newIndex = currentImageIndex + direction;
+
+    // Check if new index is valid
+    if (newIndex >= 0 && newIndex < galleryItems.length) {
+        currentImageIndex = newIndex;
+        const nextItem = galleryItems[newIndex];
+
+        // Get the media source directly from the gallery item's onclick attribute
+        const onclickAttr = nextItem.getAttribute('onclick');
+        const mediaPath = onclickAttr.split("'")[1];  // Extract path from onclick="openModal('path',..."
+        const isVideo = mediaPath.endsWith('.mp4');
+
+        // Use existing openModal function to handle the display and metadata
+        openModal(mediaPath, isVideo, nextItem, newIndex);
+    }
+}
@@ -1,49 +1,348 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import hashlib
 import html
+from operator import attrgetter
+import os
+import re
+from string import Template
 from typing import TypedDict
 
-from pydantic import TypeAdapter
+from attrs import define
+from pydantic import BaseModel, TypeAdapter
 
-from civitai import ModelResponseData, ModelVersion, Tag
+from civitai import Tag
 from civitai_manager.utils.config import Config
-from data import INFO_SUFFIX, MISSING_FILES_NAME, ModelData
-from file_types import HashFileData, HashFileDataTA, StoredFile
+from data import HASH_SUFFIX, HTML_SUFFIX, INFO_SUFFIX, MISSING_FILES_NAME, MODEL_VERSION_SUFFIX, read_missing_models
+from file_types import StoredFile
 from ..string_utils import sanitize_filename
-from datetime import datetime
-
-class BaseModelsByTypeEntry(TypedDict):
+from .static_assets import ASSETS_DIR, asset_version, copy_static_assets
+from datetime import datetime, timezone
+
+# One card of the global summary. A slotted record rather than a dict, so the
+# render loop reads plain attributes; the version fields default to what
+# missing-from-Civitai models (which have no version data) display.
+@define
+class ModelsByTypeEntry:
     name: str
     creator: str
     downloads: int
     base_name: str
     html_file: str
-    tags: Iterable[Tag | str]
+    tags: list[str]
     baseModel: str | None
     trainedWords: list[str]
     createdAt: datetime | None
     updatedAt: datetime | None
     missing: bool
     has_html: bool
+    version_name: str = ''
+    added_date: str | None = ''
+    file_size: int | float | None = 0
+
+# Lowercased search fields of one card, embedded in index.html as JSON for the page script
+class SearchIndexEntry(TypedDict):
+    name: str
+    filename: str
+    tags: list[str]
+
+SearchIndexTA = TypeAdapter(list[SearchIndexEntry])
+
+# Subsets of the civitai models holding only the fields read for the summary.
+# Undeclared keys (descriptions, images, other versions...) are skipped by the
+# JSON parser instead of being validated into objects that are then discarded.
+class _CreatorSummary(BaseModel):
+    username: str
+
+class _ModelSummary(BaseModel):
+    name: str
+    type: str
+    creator: _CreatorSummary
+    tags: list[Tag | str]
+
+class _StatsSummary(BaseModel):
+    downloadCount: int
+
+class _FileSummary(BaseModel):
+    sizeKB: float
+
+class _VersionSummary(BaseModel):
+    name: str
+    stats: _StatsSummary
+    files: list[_FileSummary]
 
-class MissingFromCivitai(BaseModelsByTypeEntry):
-    pass
+_StoredVersionSummary = StoredFile[_VersionSummary]
 
-MissingFromCivitaiTA = TypeAdapter(MissingFromCivitai)
+def _e(value: object) -> str:
+    """Escape a value for use in HTML text or a quoted attribute"""
+    # html.escape's chained str.replace calls beat a str.translate table here:
+    # translate falls off its fast path as soon as a mapping expands a character
+    return html.escape(str(value))
 
-# class MissingFromCivitai(BaseModelsByTypeEntry):
-#     version_name: None
-#     added_date: None
-#     file_size: None
+def get_tag_name(tag: Tag | str) -> str:
+    return tag.name if isinstance(tag, Tag) else tag
 
+@lru_cache(maxsize=4096)
+def _tags_html(tags: tuple[str, ...]) -> str:
+    """Render a card's tag chips; tag sets repeat a lot across a library, so results are cached"""
+    return ''.join(f'<span class="tag">{_e(tag)}</span>' for tag in tags)
 
-class ModelsByTypeEntry(BaseModelsByTypeEntry):
-    version_name: str
-    added_date: datetime | None
-    file_size: int | float | None
+# Stylesheet and script shared by index.html, copied into <output>/assets/
+BROWSER_ASSETS = ('browser.css', 'browser.js')
 
-def get_html_tags(tags: Iterable[Tag | str]) -> str:
-    return ','.join(tag.name.lower() if isinstance(tag, Tag) else tag.lower() for tag in tags)
+# This module and its assets; a change to any of them changes the page even when no model did
+_RENDERER_FILES = (Path(__file__), *(ASSETS_DIR / name for name in BROWSER_ASSETS))
+
+# Static page shell of index.html, split around the type sections that are streamed
+# between head and tail; only the $-placeholders change between runs
+_PAGE_HEAD = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Civitai Data Manager</title>
+    <link rel="stylesheet" href="assets/browser.css?v=$css_version">
+</head>
+<body>
+    <div class="container">
+        <div class="search-container">
+            <h1>Civitai Data Manager</h1>
+            <br />
+            <h2>($total_models models)</h2>
+
+            <div class="controls">
+                <input type="text" class="search-box" id="searchBox" placeholder="Search by name, filename, or tags (comma separated)...">
+                <select id="sortSelect" class="sort-select">
+                    <option value="date-desc">Date Added (Newest First)</option>
+                    <option value="date-asc">Date Added (Oldest First)</option>
+                    <option value="downloads-desc">Downloads (High to Low)</option>
+                    <option value="downloads-asc">Downloads (Low to High)</option>
+                    <option value="name-asc">Name (A to Z)</option>
+                    <option value="name-desc">Name (Z to A)</option>
+                    <option value="creator-asc">Creator (A to Z)</option>
+                    <option value="creator-desc">Creator (Z to A)</option>
+                    <option value="size-asc">File size (Small to Large)</option>
+                    <option value="size-desc">File size (Large to Small)</option>
+                </select>
+                <button id="toggleCovers" class="toggle-button">Show Covers</button>
+            </div>
+        </div>
+""")
+
+_PAGE_TAIL = Template("""
+    </div>
+
+    <div class="footer">
+        Civitai Data Manager. Version $version. <a href="https://github.com/jeremysltn/civitai-data-manager">GitHub</a>
+        <br />
+        Generated: $generated
+    </div>
+
+    <script type="application/json" id="model-index">$search_index</script>
+    <script src="assets/browser.js?v=$js_version" defer></script>
+</body>
+</html>
+""")
+
+# Markup of one model card; filled in with a single str.format call per card
+_CARD_TEMPLATE = """
+                <div class="model-card{classes}"
+                    data-name="{name_lc}"
+                    data-creator="{creator_lc}"
+                    data-downloads="{downloads}"
+                    data-raw-size="{raw_size}"
+                    data-added-date="{added_date}">
+                    <img class="model-cover" src="{preview_path}" onerror="if (this.src.includes('preview_0')) {{ this.src = this.src.replace('preview_0', 'preview_1'); }} else {{ this.style.display='none'; }}" loading="lazy">
+                    <h3>{model_name}</h3>
+                    <small class="version-name">{version_name}</small>
+                    <div>by {creator}</div>
+                    {base_model_section}
+                    {downloads_section}
+                    {filesize_section}
+                    {dates_section}
+                    <div class="tags">
+                        {tags_html}
+                    </div>
+                    {trained_words_section}
+                </div>
+"""
+
+# The hash file is only read for its timestamp, so pull it out of the raw bytes
+_TIMESTAMP_RE = re.compile(rb'"timestamp"\s*:\s*"([^"]+)"')
+
+def _scan_model_files(root: Path) -> Iterator[Path]:
+    """
+    Find all model info files in the output directory
+
+    Matches both `<base>/<base>_civitai_model.json` and the nested
+    `<base>/<dir>/civitai_model.json` layout with one scandir per directory.
+    Symlinked directories and files are followed, as glob does, but a
+    directory reached through more than one link is only visited once.
+
+    Args:
+        root (Path): Output directory to scan
+
+    Returns:
+        Iterator[Path]: Paths of the model info files found
+    """
+    nested_name = INFO_SUFFIX.removeprefix("_")
+    seen_dirs = set[tuple[int, int]]()
+
+    def first_visit(entry: os.DirEntry[str]) -> bool:
+        # Directories are told apart by (device, inode), so symlinks to the same one collapse
+        st = entry.stat()
+        key = (st.st_dev, st.st_ino)
+        if key in seen_dirs:
+            return False
+        seen_dirs.add(key)
+        return True
+
+    try:
+        model_dirs = [entry for entry in os.scandir(root) if entry.is_dir() and first_visit(entry)]
+    except PermissionError:
+        return
+
+    for model_dir in model_dirs:
+        try:
+            entries = list(os.scandir(model_dir.path))
+        except PermissionError:
+            continue
+        for entry in entries:
+            if entry.name.endswith(INFO_SUFFIX) and entry.is_file():
+                yield Path(entry.path)
+            elif entry.is_dir() and first_visit(entry):
+                nested_file = Path(entry.path) / nested_name
+                if nested_file.is_file():
+                    yield nested_file
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a whole file with one unbuffered read
+
+    The summary's input files are small and parsed in one go, so the
+    BufferedReader that Path.read_bytes() sets up only adds overhead.
+
+    Args:
+        path (Path): File to read
+
+    Returns:
+        bytes: File contents
+    """
+    with open(path, 'rb', buffering=0) as f:
+        return f.readall()
+
+def _read_model_entry(model_file: Path) -> tuple[str, ModelsByTypeEntry]:
+    """
+    Read the JSON files of one model directory into a summary entry
+
+    Args:
+        model_file (Path): Path to the model info file
+
+    Returns:
+        tuple[str, ModelsByTypeEntry]: Model type and its summary entry
+    """
+    # Get paths for model, version, and hash files
+    model_dir = model_file.parent
+    base_name = model_dir.name
+    version_name = f"{base_name}{MODEL_VERSION_SUFFIX}"
+    hash_name = f"{base_name}{HASH_SUFFIX}"
+    html_name = f"{base_name}{HTML_SUFFIX}"
+
+    # List the model directory once instead of stat()ing each sibling file
+    sibling_names = {entry.name for entry in os.scandir(model_dir)}
+
+    # Read each file in a single unbuffered read; pydantic parses the UTF-8 JSON directly
+    model_data = _ModelSummary.model_validate_json(_read_bytes(model_file))
+
+    version_data: _StoredVersionSummary | None = None
+    if version_name in sibling_names:
+        version_data = _StoredVersionSummary.model_validate_json(_read_bytes(model_dir / version_name))
+
+    added_date: str | None = None
+    if hash_name in sibling_names:
+        match = _TIMESTAMP_RE.search(_read_bytes(model_dir / hash_name))
+        if match:
+            added_date = match.group(1).decode('utf-8')
+
+    return model_data.type, ModelsByTypeEntry(
+        # Add model data
+        name=model_data.name,
+        creator=model_data.creator.username,
+        base_name=base_name,
+        html_file=html_name,
+        tags=[get_tag_name(tag) for tag in model_data.tags],
+        # Add version data
+        version_name=version_data.data.name if version_data else "Unknown",
+        downloads=version_data.data.stats.downloadCount if version_data else 0,
+        has_html=html_name in sibling_names,
+        added_date=added_date,
+        file_size=version_data.data.files[0].sizeKB if version_data else None,
+        baseModel="",
+        trainedWords=[],
+        createdAt=datetime.now(),
+        updatedAt=None,
+        missing=False,
+    )
+
+def _load_model_entry(model_file: Path) -> tuple[str, ModelsByTypeEntry] | None:
+    """
+    Like _read_model_entry, but skip (and report) a model whose files can't be read
+
+    Args:
+        model_file (Path): Path to the model info file
+
+    Returns:
+        tuple[str, ModelsByTypeEntry] | None: Model type and its summary entry, or None if unreadable
+    """
+    try:
+        return _read_model_entry(model_file)
+    except (OSError, ValueError, IndexError) as e:
+        # ValueError covers pydantic.ValidationError, e.g. an error payload saved instead of model data
+        print(f"Skipping {model_file.parent.name} in global summary: {e}")
+        return None
+
+# Sidecar next to index.html holding the input hash of the last generated page
+SUMMARY_CACHE_KEY_NAME = '.index.cache-key'
+
+def _summary_cache_key(model_files: list[Path], extra_files: Iterable[Path], VERSION: str) -> tuple[str, set[Path]]:
+    """
+    Hash everything the global summary is built from
+
+    Covers the script version plus path, mtime and size of each model's info,
+    version, hash and html files, of any extra input files and of this module
+    and its assets. Missing files
+    are hashed as such, so creating or deleting one changes the key.
+
+    Args:
+        model_files (list[Path]): Model info files found in the output directory
+        extra_files (Iterable[Path]): Other files the summary depends on
+        VERSION (str): Version of the script
+
+    Returns:
+        tuple[str, set[Path]]: Hex digest identifying the summary inputs, and the
+            watched files that exist (so callers need not stat them again)
+    """
+    watched: list[Path] = [*_RENDERER_FILES, *extra_files]
+    for model_file in model_files:
+        model_dir = model_file.parent
+        base_name = model_dir.name
+        watched.append(model_file)
+        watched.extend(model_dir / f"{base_name}{suffix}" for suffix in (MODEL_VERSION_SUFFIX, HASH_SUFFIX, HTML_SUFFIX))
+
+    digest = hashlib.blake2b(VERSION.encode('utf-8'), digest_size=16)
+    existing = set[Path]()
+    for path in sorted(watched):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            digest.update(f"{path}:missing;".encode('utf-8'))
+            continue
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode('utf-8'))
+        existing.add(path)
+    return digest.hexdigest(), existing
 
 def generate_global_summary(config: Config, VERSION: str):
     """
@@ -53,85 +352,66 @@ def generate_global_summary(config: Config, VERSION: str):
         output_dir (Path): Directory containing the JSON files
         VERSION (str): Version of the script
     """
+    generated_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
     # Find all model.json files
-    model_files = list(Path(config.output).glob(f"*/*/{INFO_SUFFIX[1:] if INFO_SUFFIX.startswith("_") else INFO_SUFFIX}")) + \
-                    list(Path(config.output).glob(f"*/*{INFO_SUFFIX}"))
+    model_files = list(_scan_model_files(config.output))
     
     # Read missing models file
-    missing_models = set[str]()
     missing_file = config.output / MISSING_FILES_NAME
-    if missing_file.exists():
-        with open(missing_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip() and not line.startswith('#'):
-                    # Extract filename from the line
-                    filename = line.strip().split(' | ')[-1]
-                    missing_models.add(filename)
+    missing_models = read_missing_models(missing_file)
+
+    # The page links to its stylesheet and script instead of inlining them
+    _ = copy_static_assets(config.output, BROWSER_ASSETS)
+
+    # Skip the rebuild when none of the inputs changed since the last run
+    summary_path = config.output / 'index.html'
+    cache_key_path = config.output / SUMMARY_CACHE_KEY_NAME
+    # Each listed filename's stem, derived once and shared by both passes over them
+    missing_stems = {filename: Path(filename).stem for filename in missing_models}
+    missing_html_files: dict[str, Path] = {}
+    for filename, stem in missing_stems.items():
+        sanitized_name = sanitize_filename(stem)
+        missing_html_files[filename] = config.output / sanitized_name / f"{sanitized_name}{HTML_SUFFIX}"
+    cache_key, existing_inputs = _summary_cache_key(model_files, [missing_file, *missing_html_files.values()], VERSION)
+    if summary_path.exists() and cache_key_path.exists() and cache_key_path.read_text(encoding='utf-8') == cache_key:
+        print(f"\nGlobal summary is up to date: {summary_path}")
+        return True
     
     # Dictionary to store models by type
-    models_by_type: dict[str, list[ModelsByTypeEntry | MissingFromCivitai]] = {}
+    models_by_type: dict[str, list[ModelsByTypeEntry]] = {}
     
-    for model_file in model_files:
-        # Get paths for model, version, and hash files
-        base_name = model_file.parent.name
-        version_file = model_file.parent / f"{base_name}_civitai_model_version.json"
-        hash_file = model_file.parent / f"{base_name}_hash.json"
-        html_file = model_file.parent / f"{base_name}.html"
-
-        # Read all files
-        with open(model_file, 'r', encoding='utf-8') as f:
-            model_data = ModelResponseData.model_validate_json(f.read())
-
-        version_data: StoredFile[ModelVersion] | None = None
-        if version_file.exists():
-            with open(version_file, 'r', encoding='utf-8') as f:
-                version_data = StoredFile[ModelVersion].model_validate_json(f.read())
-
-        hash_data: HashFileData | None = None
-        if hash_file.exists():
-            with open(hash_file, 'r', encoding='utf-8') as f:
-                hash_data = HashFileDataTA.validate_json(f.read())
-
-        if model_data.type not in models_by_type:
-            models_by_type[model_data.type] = []
-            
-        models_by_type[model_data.type].append(ModelsByTypeEntry(
-            # Add model data
-            name=model_data.name,
-            creator=model_data.creator.username,
-            base_name=base_name,
-            html_file=f"{base_name}.html",
-            tags=model_data.tags,
-            # Add version data
-            version_name=version_data.data.name if version_data else "Unknown",
-            downloads=version_data.data.stats.downloadCount if version_data else 0,
-            has_html=html_file.exists(),
-            added_date=hash_data["timestamp"] if hash_data else None,
-            file_size=version_data.data.files[0].sizeKB if version_data else None,
-            baseModel="",
-            trainedWords=[],
-            createdAt=datetime.now(),
-            updatedAt=None,
-            missing=False,
-        ))
+    # Model files are independent and reading them is I/O-bound, so load them
+    # concurrently and group the results by type on this thread; small libraries
+    # don't need more threads than they have files
+    max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(model_files)))
+    skipped_models = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(_load_model_entry, model_files):
+            if result is None:
+                skipped_models += 1
+                continue
+            model_type, entry = result
+            if model_type not in models_by_type:
+                models_by_type[model_type] = []
+            models_by_type[model_type].append(entry)
 
     # Process missing models
     if missing_models:
         if 'Missing from Civitai' not in models_by_type:
             models_by_type['Missing from Civitai'] = []
         
-        for filename in missing_models:
-            model = ModelData(base_dir=Path(config.all or "."), safetensors=Path(filename))
-            base_name = Path(filename).stem
-            html_file = model.paths.html
-            html_exists = html_file.exists()
+        # Add them already ordered by lowercased name, so this group needs no sort afterwards
+        for _, base_name, filename in sorted((stem.lower(), stem, filename) for filename, stem in missing_stems.items()):
+            # Already stat()ed while computing the cache key
+            html_exists = missing_html_files[filename] in existing_inputs
 
-            models_by_type['Missing from Civitai'].append(MissingFromCivitai(
+            models_by_type['Missing from Civitai'].append(ModelsByTypeEntry(
                 name=base_name,
                 creator='Unknown',
                 downloads=0,
                 base_name=base_name,
-                html_file=f"{base_name}.html" if html_exists else '',
+                html_file=f"{base_name}{HTML_SUFFIX}" if html_exists else '',
                 tags=[],
                 baseModel=None,
                 trainedWords=[],
@@ -141,421 +421,113 @@ def generate_global_summary(config: Config, VERSION: str):
                 has_html=html_exists
             ))
 
-    # Sort each type's models
-    for model_type in models_by_type:
+    # Sort each type's models by downloads (missing models were added in name order)
+    for model_type, models in models_by_type.items():
         if model_type != 'Missing from Civitai':
-            models_by_type[model_type].sort(key=lambda x: x['downloads'], reverse=True)
-        else:
-            models_by_type[model_type].sort(key=lambda x: x['name'].lower())
+            models.sort(key=attrgetter('downloads'), reverse=True)
 
-    # Create sections HTML for each type
-    type_sections = ''
+    # Lowercased search fields per card, in card order, read once by the page script
+    search_index: list[SearchIndexEntry] = []
     total_models = sum(len(models) for models in models_by_type.values())
-    
-    for model_type, models in sorted(models_by_type.items()):
-        # Create model cards first
-        model_cards: list[str] = []
-        for model in models:
-            sanitized_base = sanitize_filename(model["base_name"])
-            html_name = f"{sanitized_base}.html"
-            model_name = (
-                f'<a href="{sanitized_base}/{html_name}">{html.escape(model["name"])}</a>'
-                if model.get('has_html', False) or not model.get('missing')
-                else '<span class="missing-model">' + html.escape(model['name']) + '</span>'
-            )
+
+    # Stream the page to a temporary file fragment by fragment, then swap it into place
+    tmp_path = summary_path.with_suffix('.html.tmp')
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write = f.write
+        _ = write(_PAGE_HEAD.substitute(total_models=total_models, css_version=asset_version('browser.css')))
+        
+        for model_type, models in sorted(models_by_type.items()):
+            # Open the section, then emit every model card straight into it
+            _ = write(f"""
+                <div class="type-section" data-type="{_e(model_type.lower())}">
+                    <h2>{_e(model_type)} ({len(models)} models)</h2>
+                    <div class="models-grid">
+                        """)
+            for model in models:
+                # Derive each lowercased / sanitized value once per card
+                name_lower = model.name.lower()
+                name_lc = _e(name_lower)
+                creator_lc = _e(model.creator.lower())
+                search_index.append(SearchIndexEntry(
+                    name=name_lower,
+                    filename=model.base_name.lower(),
+                    tags=[tag.lower() for tag in model.tags],
+                ))
+                sanitized_base = sanitize_filename(model.base_name)
+                html_name = f"{sanitized_base}.html"
+                model_name = (
+                    f'<a href="{sanitized_base}/{html_name}">{_e(model.name)}</a>'
+                    if model.has_html or not model.missing
+                    else '<span class="missing-model">' + _e(model.name) + '</span>'
+                )
             
-            dates_section = ''
-            if model.get('createdAt', "Unknown") != "Unknown":
-                created_date = model['createdAt']
-                updated_date = model['updatedAt']
-                dates_section = f'<div class="dates">Created: {created_date}{updated_date}</div>'
+                dates_section = ''
+                if model.createdAt != "Unknown":
+                    created_date = model.createdAt
+                    updated_date = model.updatedAt
+                    dates_section = f'<div class="dates">Created: {_e(created_date)}{_e(updated_date)}</div>'
             
-            base_model_section = ''
-            if model.get('baseModel', 'Unknown') != 'Unknown':
-                base_model_section = f'<div class="base-model">Base Model: {model["baseModel"]}</div>'
+                base_model_section = ''
+                if model.baseModel != 'Unknown':
+                    base_model_section = f'<div class="base-model">Base Model: {_e(model.baseModel)}</div>'
             
-            downloads_section = ''
-            if not model.get('missing'):
-                downloads_section = f'<div class="downloads">Downloads: {model["downloads"]:,}</div>'
+                downloads_section = ''
+                if not model.missing:
+                    downloads_section = f'<div class="downloads">Downloads: {model.downloads:,}</div>'
             
-            filesize_section = ''
-            if model.get('file_size'):
-                if "file_size" in model and model['file_size'] is not None:
-                    size = model["file_size"]/1024
-                else:
-                    size = 0
-                filesize_section = f'<div class="file-size">Size: {size} MB</div>'
+                filesize_section = ''
+                if model.file_size:
+                    size = model.file_size/1024
+                    filesize_section = f'<div class="file-size">Size: {size} MB</div>'
             
-            trained_words_section = ''
-            if model.get('trainedWords'):
-                trained_words_section = f'<div class="trained-words">{", ".join(model["trainedWords"])}</div>'
+                trained_words_section = ''
+                if model.trainedWords:
+                    trained_words_section = f'<div class="trained-words">{_e(", ".join(model.trainedWords))}</div>'
             
-            tags_html = ''.join(f'<span class="tag">{tag}</span>' for tag in model['tags'])
+                tags_html = _tags_html(tuple(model.tags))
             
-            sanitized_base_name = sanitize_filename(model['base_name'])
-            preview_path = f"{sanitized_base_name}/{sanitized_base_name}_preview_0.jpeg"
+                preview_path = f"{sanitized_base}/{sanitized_base}_preview_0.jpeg"
             
-            card_html = f"""
-                <div class="model-card{' missing' if model.get('missing') else ''}{' processed' if model.get('has_html') else ''}" 
-                data-tags="{get_html_tags(model['tags'])}"
-                data-name="{model['name'].lower()}"
-                data-creator="{model['creator'].lower()}"
-                data-downloads="{model['downloads']}"
-                data-filename="{model['base_name'].lower()}"
-                data-raw-size="{model.get('file_size', 0)}"
-                data-added-date="{model.get('added_date', '')}">
-                    <img class="model-cover" src="{preview_path}" onerror="if (this.src.includes('preview_0')) {{ this.src = this.src.replace('preview_0', 'preview_1'); }} else {{ this.style.display='none'; }}" loading="lazy">
-                    <h3>{model_name}</h3>
-                    <small class="version-name">{model.get('version_name', '')}</small>
-                    <div>by {model['creator']}</div>
-                    {base_model_section}
-                    {downloads_section}
-                    {filesize_section}
-                    {dates_section}
-                    <div class="tags">
-                        {tags_html}
+                _ = write(_CARD_TEMPLATE.format(
+                    classes=(' missing' if model.missing else '') + (' processed' if model.has_html else ''),
+                    name_lc=name_lc,
+                    creator_lc=creator_lc,
+                    downloads=model.downloads,
+                    raw_size=model.file_size,
+                    added_date=_e(model.added_date),
+                    preview_path=preview_path,
+                    model_name=model_name,
+                    version_name=_e(model.version_name),
+                    creator=_e(model.creator),
+                    base_model_section=base_model_section,
+                    downloads_section=downloads_section,
+                    filesize_section=filesize_section,
+                    dates_section=dates_section,
+                    tags_html=tags_html,
+                    trained_words_section=trained_words_section,
+                ))
+
+            _ = write("""
                     </div>
-                    {trained_words_section}
                 </div>
-            """
-            model_cards.append(card_html)
-
-        # Create section with all model cards
-        type_sections += f"""
-            <div class="type-section" data-type="{model_type.lower()}">
-                <h2>{model_type} ({len(models)} models)</h2>
-                <div class="models-grid">
-                    {''.join(model_cards)}
-                </div>
-            </div>
-        """
-
-    # Update the HTML content with type sections
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Civitai Data Manager</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            font-size: 0.8rem;
-            color: #666;
-        }}
-        .search-container {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        .controls {{
-            display: flex;
-            gap: 10px;
-            justify-content: center;
-            align-items: center;
-            flex-wrap: wrap;
-            margin: 20px 0;
-        }}
-        .search-box {{
-            width: 400px;
-            padding: 10px;
-            font-size: 16px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-        }}
-        .sort-select {{
-            padding: 10px;
-            font-size: 16px;
-            border: 2px solid #ddd;
-            border-radius: 4px;
-            background-color: white;
-            cursor: pointer;
-        }}
-        .sort-select:hover {{
-            border-color: #3498db;
-        }}
-        .models-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 20px;
-        }}
-        .model-card {{
-            position: relative;
-            background-color: #f8f9fa;
-            border: 1px solid #eee;
-            border-radius: 8px;
-            padding: 15px;
-            transition: transform 0.2s;
-        }}
-        .model-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .model-card.processed {{
-            min-height: 200px;
-        }}
-        .model-card.missing {{
-            background-color: #fff3f3;
-            border: 1px solid #ffcdd2;
-        }}
-        .model-cover {{
-            display: none;
-            width: 100%;
-            height: 400px;
-            object-fit: cover;
-            object-position: top;
-            border-radius: 8px;
-            margin-bottom: 15px;
-        }}
-        .show-covers .model-cover {{
-            display: block;
-        }}
-        .toggle-button {{
-            padding: 14px 16px;
-            background-color: #3498db;
-            color: white;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            margin: 10px 0;
-        }}
-        .toggle-button:hover {{
-            background-color: #2779af;
-        }}
-        .toggle-button.active {{
-            background-color: #27ae60;
-        }}
-        .missing-model {{
-            color: #d32f2f;
-        }}
-        .downloads {{
-            color: #666;
-            font-size: 0.9em;
-        }}
-        .file-size {{
-            color: #666;
-            font-size: 0.9em;
-            margin-bottom: 10px;
-        }}
-        .tags {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 4px;
-            margin-top: 10px;
-        }}
-        .tag {{
-            background-color: #3498db;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.8em;
-        }}
-        h1 {{
-            color: #2c3e50;
-        }}
-        h3 {{
-            margin: 0;
-        }}
-        .version-name {{
-            margin-top: -5px;
-            display: block;
-        }}
-        .hidden {{
-            display: none !important;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            color: #2779af;
-            text-decoration: underline;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="search-container">
-            <h1>Civitai Data Manager</h1>
-            <br />
-            <h2>({total_models} models)</h2>
-
-            <div class="controls">
-                <input type="text" class="search-box" id="searchBox" placeholder="Search by name, filename, or tags (comma separated)...">
-                <select id="sortSelect" class="sort-select">
-                    <option value="date-desc">Date Added (Newest First)</option>
-                    <option value="date-asc">Date Added (Oldest First)</option>
-                    <option value="downloads-desc">Downloads (High to Low)</option>
-                    <option value="downloads-asc">Downloads (Low to High)</option>
-                    <option value="name-asc">Name (A to Z)</option>
-                    <option value="name-desc">Name (Z to A)</option>
-                    <option value="creator-asc">Creator (A to Z)</option>
-                    <option value="creator-desc">Creator (Z to A)</option>
-                    <option value="size-asc">File size (Small to Large)</option>
-                    <option value="size-desc">File size (Large to Small)</option>
-                </select>
-                <button id="toggleCovers" class="toggle-button">Show Covers</button>
-            </div>
-        </div>
-        {type_sections}
-    </div>
-
-    <div class="footer">
-        Civitai Data Manager. Version {VERSION}. <a href="https://github.com/jeremysltn/civitai-data-manager">GitHub</a>
-        <br />
-        Generated: {datetime.now().isoformat()}
-    </div>
-
-    <script>
-        // Search box
-        const searchBox = document.getElementById('searchBox');
-        const modelCards = document.querySelectorAll('.model-card');
-        const sortSelect = document.getElementById('sortSelect');
-
-        function sortCards() {{
-            const [sortKey, sortDir] = sortSelect.value.split('-');
-            const sections = document.querySelectorAll('.type-section');
-            
-            sections.forEach(section => {{
-                const cards = Array.from(section.querySelectorAll('.model-card:not(.hidden)'));
-                
-                cards.sort((a, b) => {{
-                    let aVal, bVal;
-                    
-                    switch(sortKey) {{
-                        case 'date':
-                            aVal = a.dataset.addedDate || '';
-                            bVal = b.dataset.addedDate || '';
-                            break;
-                        case 'downloads':
-                            aVal = parseInt(a.dataset.downloads) || 0;
-                            bVal = parseInt(b.dataset.downloads) || 0;
-                            break;
-                        case 'name':
-                            aVal = a.dataset.name;
-                            bVal = b.dataset.name;
-                            break;
-                        case 'creator':
-                            aVal = a.dataset.creator;
-                            bVal = b.dataset.creator;
-                            break;
-                        case 'size':
-                            aVal = parseFloat(a.dataset.rawSize) || 0;
-                            bVal = parseFloat(b.dataset.rawSize) || 0;
-                            break;
-                        default:
-                            return 0;
-                    }}
-                    
-                    if (sortDir === 'asc') {{
-                        return aVal > bVal ? 1 : -1;
-                    }} else {{
-                        return aVal < bVal ? 1 : -1;
-                    }}
-                }});
-                
-                const grid = section.querySelector('.models-grid');
-                cards.forEach(card => grid.appendChild(card));
-            }});
-        }}
-
-        searchBox.addEventListener('input', function() {{
-            const searchTerms = searchBox.value.toLowerCase().split(',').map(term => term.trim()).filter(term => term);
-            
-            modelCards.forEach(card => {{
-                if (!searchTerms.length) {{
-                    card.classList.remove('hidden');
-                    return;
-                }}
-                
-                const cardTags = card.dataset.tags.split(',');
-                const cardName = card.dataset.name;
-                const cardFilename = card.dataset.filename;
-                
-                const matchesSearch = searchTerms.every(searchTerm => 
-                    // Check tags
-                    cardTags.some(cardTag => cardTag.includes(searchTerm)) ||
-                    // Check model name
-                    cardName.includes(searchTerm) ||
-                    // Check filename
-                    cardFilename.includes(searchTerm)
-                );
-                
-                if (matchesSearch) {{
-                    card.classList.remove('hidden');
-                }} else {{
-                    card.classList.add('hidden');
-                }}
-            }});
-
-            // Show/hide section headers based on visible cards
-            document.querySelectorAll('.type-section').forEach(section => {{
-                const visibleCards = section.querySelectorAll('.model-card:not(.hidden)').length;
-                section.style.display = visibleCards > 0 ? 'block' : 'none';
-            }});
-            
-            // Re-sort visible cards
-            sortCards();
-        }});
-
-        // Sort functionality
-        sortSelect.addEventListener('change', sortCards);
-        
-        // Load saved sort preference
-        const savedSort = localStorage.getItem('sortPreference') || 'date-desc';
-        sortSelect.value = savedSort;
-        
-        // Initial sort
-        sortCards();
-
-        // Save sort preference when changed
-        sortSelect.addEventListener('change', function() {{
-            localStorage.setItem('sortPreference', this.value);
-            sortCards();
-        }});
-
-        // Image covers toggle
-        const toggleButton = document.getElementById('toggleCovers');
-        const container = document.querySelector('.container');
-
-        // Check local storage for user preference
-        const showCovers = localStorage.getItem('showCovers') === 'true';
-        if (showCovers) {{
-            container.classList.add('show-covers');
-            toggleButton.classList.add('active');
-        }}
-
-        toggleButton.addEventListener('click', function() {{
-            container.classList.toggle('show-covers');
-            this.classList.toggle('active');
-            
-            // Save preference to local storage
-            localStorage.setItem('showCovers', container.classList.contains('show-covers'));
-        }});
-    </script>
-</body>
-</html>
-"""
+            """)
+
+        # Keep '</script>' out of the embedded JSON
+        search_index_json = SearchIndexTA.dump_json(search_index).replace(b'<', b'\\u003c').decode('utf-8')
+        _ = write(_PAGE_TAIL.substitute(
+            search_index=search_index_json,
+            version=VERSION,
+            generated=generated_at,
+            js_version=asset_version('browser.js'),
+        ))
 
-    # Write the summary file
-    summary_path = config.output / 'index.html'
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        _ = f.write(html_content)
+    # Publish the summary, then record which inputs it was built from; a summary missing
+    # unreadable models is not cached, so the next run reports them again
+    os.replace(tmp_path, summary_path)
+    if skipped_models:
+        cache_key_path.unlink(missing_ok=True)
+    else:
+        _ = cache_key_path.write_text(cache_key, encoding='utf-8')
     
     print(f"\nGlobal summary generated: {summary_path}")
     return True
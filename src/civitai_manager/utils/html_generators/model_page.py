@@ -1,11 +1,202 @@
-import json
-import html
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+import os
+from pathlib import Path
+from typing import Literal, cast
+
+import jinja2
+from markupsafe import Markup, escape
+import pydantic
 
 import civitai
 from civitai_manager.utils.config import Config
 from data import ModelData
 from file_types import HashFileDataTA, StoredFile
-from datetime import datetime
+from datetime import datetime, timezone
+from .browser_page import get_tag_name
+from .static_assets import ASSETS_DIR, asset_version, copy_static_assets
+
+# Validators shared by every page; the StoredFile generic is parametrized once here rather than per call
+StoredModelVersion = StoredFile[civitai.ModelVersion]
+
+# The fields of the info file the page reads: model details, and each version's id, stats and file sizes
+class _PageFileInfo(pydantic.BaseModel):
+    sizeKB: float
+
+class _PageVersionInfo(pydantic.BaseModel):
+    id: civitai.ModelVersionId
+    stats: civitai.ModelVersionStats
+    files: list[_PageFileInfo]
+
+class _PageModelInfo(pydantic.BaseModel):
+    id: civitai.ModelId
+    name: str
+    description: str
+    type: str
+    nsfw: bool
+    tags: list[civitai.Tag | str]
+    creator: civitai.Creator
+    allowCommercialUse: str | list[str] | None = pydantic.Field(default=None)
+    modelVersions: list[_PageVersionInfo]
+
+# Preview metadata sidecars; parsed and re-serialized (compactly) by pydantic's Rust JSON core
+PreviewMetadataTA = pydantic.TypeAdapter(dict[str, pydantic.JsonValue])
+
+# NSFW badge colour per nsfw flag, and for anything else
+_NSFW_BG = {0: '#27ae60', 1: '#e93826'}
+_NSFW_DEFAULT = '#95a5a6'
+
+# Preview file extensions, in the order their previews appear in the gallery
+PREVIEW_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.mp4')
+
+# Page template field -> ModelVersionStats counter it displays
+STAT_COUNT_FIELDS = {
+    'downloads': 'downloadCount',
+    'favorites': 'favoriteCount',
+    'comments': 'commentCount',
+    'tips': 'tippedAmountCount',
+    'thumbs_up': 'thumbsUpCount',
+    'thumbs_down': 'thumbsDownCount',
+}
+
+# Stylesheet and gallery script shared by every model page, copied into <output>/assets/ and linked from ../assets/
+MODEL_PAGE_ASSETS = ('model.css', 'model.js')
+
+# Outcome of rendering one model page
+type PageResult = Literal['generated', 'up_to_date', 'failed']
+
+# Generation time stamped in the footer of every page written by this run, so
+# a batch shares one value instead of reading the clock per page
+_GENERATED_AT = datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+# Page template, compiled once; templates are not reloaded from disk during a run
+TEMPLATES_DIR = Path(__file__).with_name('templates')
+_TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+    autoescape=True,
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_PAGE_TEMPLATE = _TEMPLATE_ENV.get_template('model_page.html.j2')
+
+# Newest of this module, its template and its assets; pages written before it are stale even if their data is not
+_RENDERER_MTIME_NS = max(
+    path.stat().st_mtime_ns
+    for path in (Path(__file__), TEMPLATES_DIR / 'model_page.html.j2', *(ASSETS_DIR / name for name in MODEL_PAGE_ASSETS))
+)
+
+# The template's generator tag sits in the page head, well within this many leading bytes
+_GENERATOR_TAG_SCAN_BYTES = 1024
+
+
+def _generator_tag(VERSION: str) -> bytes:
+    """The generator meta tag the template writes for a given script version"""
+    return f'<meta name="generator" content="Civitai Data Manager {escape(VERSION)}">'.encode('utf-8')
+
+
+def is_page_up_to_date(html_name: str, entries: dict[str, os.DirEntry[str]], model_dir: Path, VERSION: str) -> bool:
+    """
+    Check whether a model page is newer than everything it is rendered from
+
+    That is every other file in the model directory (JSON data, previews and
+    their metadata), the directory itself (so added or removed files count),
+    and this module, its template and its shared assets. The page must also
+    have been written by this script version, recorded in its generator tag.
+
+    Args:
+        html_name (str): Filename of the page in the model directory
+        entries (dict[str, os.DirEntry[str]]): Listing of the model directory
+        model_dir (Path): Model directory
+        VERSION (str): Version of the script
+
+    Returns:
+        bool: True if the page exists and needs no regeneration
+    """
+    html_entry = entries.get(html_name)
+    if html_entry is None:
+        return False
+    page_mtime = html_entry.stat().st_mtime_ns
+    if page_mtime < _RENDERER_MTIME_NS or page_mtime < model_dir.stat().st_mtime_ns:
+        return False
+    if not all(entry.stat().st_mtime_ns <= page_mtime for name, entry in entries.items() if name != html_name):
+        return False
+    with open(html_entry.path, 'rb') as f:
+        return _generator_tag(VERSION) in f.read(_GENERATOR_TAG_SCAN_BYTES)
+
+
+@lru_cache(maxsize=4096)
+def _parse_file[T](parse: Callable[[bytes], T], path: str, _mtime_ns: int, _size: int) -> T:
+    """
+    Parse a file, memoized on its path, modification time and size so an unchanged file is parsed once per process
+
+    _mtime_ns and _size are not read; they are only part of the cache key, so a modified file misses the
+    cache (the size also catches rewrites within one tick of a coarse filesystem clock).
+    """
+    return parse(Path(path).read_bytes())
+
+
+def read_parsed[T](parse: Callable[[bytes], T], entry: os.DirEntry[str]) -> T:
+    """
+    Parse a file of a model directory listing, reusing the result while the file is unchanged
+
+    Args:
+        parse (Callable[[bytes], T]): Validator taking the raw JSON bytes
+        entry (os.DirEntry[str]): Listing entry of the file; its cached stat gives the modification time
+
+    Returns:
+        T: Parsed contents, shared between calls and not to be modified
+    """
+    stat = entry.stat()
+    # lru_cache's wrapper does not carry the type parameter through
+    return cast(T, _parse_file(parse, entry.path, stat.st_mtime_ns, stat.st_size))
+
+
+def _parse_metadata_attr(data: bytes) -> Markup | str:
+    """Escaped data-metadata value of a preview metadata sidecar, or '' when it holds nothing"""
+    metadata = PreviewMetadataTA.validate_json(data)
+    # Already escaped, so the template's autoescaping leaves it alone
+    return Markup(escape_json_attr(PreviewMetadataTA.dump_json(metadata))) if metadata else ''
+
+
+def escape_json_attr(data: bytes) -> str:
+    """
+    HTML-escape serialized JSON for a single-quoted attribute
+
+    The JSON's double quotes, by far its most common special character, are
+    left as they are since they cannot end a single-quoted value. Escaping is
+    done on the encoder's bytes before decoding, which is about twice as fast
+    as decoding first.
+
+    Args:
+        data (bytes): UTF-8 JSON
+
+    Returns:
+        str: Escaped attribute value, to be placed between single quotes
+    """
+    return (
+        data.replace(b'&', b'&amp;')
+        .replace(b'<', b'&lt;')
+        .replace(b'>', b'&gt;')
+        .replace(b"'", b'&#x27;')
+        .decode('utf-8')
+    )
+
+
+def get_stat_counts(stats: civitai.ModelVersionStats | None) -> dict[str, str]:
+    """
+    Format the statistics counters shown on the model page
+
+    Args:
+        stats (civitai.ModelVersionStats | None): Statistics data
+
+    Returns:
+        dict[str, str]: Template field -> thousands-separated count, or 'N/A' without stats
+    """
+    if stats is None:
+        return dict.fromkeys(STAT_COUNT_FIELDS, 'N/A')
+    return {field: f"{getattr(stats, attribute):,}" for field, attribute in STAT_COUNT_FIELDS.items()}
 
 
 def get_rating_bar_width(stats: civitai.ModelVersionStats | None) -> float:
@@ -24,7 +215,7 @@ def get_rating_bar_width(stats: civitai.ModelVersionStats | None) -> float:
     return (thumbs_up / total_votes) * 100 if total_votes > 0 else 0
 
 
-def generate_html_summary(config: Config, model: ModelData, VERSION: str) -> None | bool:
+def generate_html_summary(config: Config, model: ModelData, VERSION: str, generated_at: str | None = None, copy_assets: bool = True) -> PageResult:
     """
     Generate an HTML summary of the model information
     
@@ -32,750 +223,172 @@ def generate_html_summary(config: Config, model: ModelData, VERSION: str) -> Non
         output_dir (Path): Directory containing the JSON files
         safetensors_path (Path): Path to the safetensors file
         VERSION (str): Version of the script
+        generated_at (str | None): Generation time shown on the page, defaults to when this run started
+        copy_assets (bool): Copy the shared stylesheet and script, off when the caller already did for a batch
+
+    Returns:
+        PageResult: 'generated', or 'up_to_date' if the existing page was kept
     """
     try:
-        # Find all preview images
-        preview_images = sorted(config.output.glob(f"{model.sanitized_name}_preview*.jpg")) + \
-                         sorted(config.output.glob(f"{model.sanitized_name}_preview*.jpeg")) + \
-                         sorted(config.output.glob(f"{model.sanitized_name}_preview*.png")) + \
-                         sorted(config.output.glob(f"{model.sanitized_name}_preview*.mp4"))
+        # Find all preview images (and their metadata files) with a single listing of the model directory
+        preview_prefix = f"{model.sanitized_name}_preview"
+        try:
+            with os.scandir(model.paths.output_dir) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
+            # Reported below as missing JSON files
+            entries = dict[str, os.DirEntry[str]]()
+        file_names = entries.keys()
+
+        # The page links to the shared stylesheet and script instead of inlining them; copied
+        # before the skip check so an up-to-date page never points at missing assets
+        if copy_assets:
+            _ = copy_static_assets(config.output, MODEL_PAGE_ASSETS)
+
+        # Skip the page if nothing it is built from changed since it was written
+        if is_page_up_to_date(model.paths.html.name, entries, model.paths.output_dir, VERSION):
+            print(f"HTML summary is up to date: {model.paths.html}")
+            return 'up_to_date'
+
+        # (extension rank, filename, stem) per preview; sorting the tuples gives the gallery order.
+        # Plain strings are enough here, no Path objects are built per file
+        preview_images: list[tuple[int, str, str]] = []
+        for name in file_names:
+            if name.startswith(preview_prefix):
+                stem, ext = os.path.splitext(name)
+                if ext in PREVIEW_EXTENSIONS:
+                    preview_images.append((PREVIEW_EXTENSIONS.index(ext), name, stem))
+        preview_images.sort()
 
         
-        # Check if all required files exist
-        missing: list[str] = []
-        for p in filter(lambda p: p.stem.endswith(".json"), model.paths.as_dict().values()):
-            if not p.exists():
-                missing.append(p.as_posix())
-        if not len(missing) == 0:
-            raise Exception(f"Error: Missing required JSON files for HTML generation: {missing}")
+        # Check if all required files exist; they all live in the model directory listed above
+        missing = [p.as_posix() for p in model.required_paths if p.name not in file_names]
+        if missing:
+            raise FileNotFoundError(f"Error: Missing required JSON files for HTML generation: {missing}")
             
         # Read JSON data
         try:
-            with open(model.paths.info, 'r', encoding='utf-8') as f:
-                model_data = civitai.ModelResponseData.model_validate_json(f.read())
-            with open(model.paths.version, 'r', encoding='utf-8') as f:
-                version_data = StoredFile[civitai.ModelVersion].model_validate_json(f.read())
-            with open(model.paths.hash, 'r', encoding='utf-8') as f:
-                print(model.paths.hash)
-                hash_data = HashFileDataTA.validate_json(f.read())
+            # Hand the raw bytes straight to pydantic's parser, skipping text decoding; files unchanged
+            # since an earlier page of this run are not parsed again
+            model_data = read_parsed(_PageModelInfo.model_validate_json, entries[model.paths.info.name])
+            version_data = read_parsed(StoredModelVersion.model_validate_json, entries[model.paths.version.name])
+            hash_data = read_parsed(HashFileDataTA.validate_json, entries[model.paths.hash.name])
 
             # Get stats data
-            model_version = next((version for version in model_data.modelVersions if version.id == version_data.data.id), None)
+            versions_by_id = {version.id: version for version in model_data.modelVersions}
+            model_version = versions_by_id.get(version_data.data.id)
             stats = model_version.stats if model_version else None
-            fileSizeKB = model_version.files[0].sizeKB if model_version else None
-            fileSizeMB = (fileSizeKB or 0) / 1024
+            # Size of the version's first file; versions without files (e.g. archived models) show 0
+            file_size_mb = round(model_version.files[0].sizeKB / 1024, 2) if model_version and model_version.files else 0
             
-            # Generate image gallery HTML
-            gallery_html = ""
+            # Gallery entries; every preview needs its metadata sidecar, read them all concurrently up front
+            previews: list[dict[str, object]] = []
             if preview_images:
-                gallery_html = """
-                <div class="section">
-                    <h2>Preview Images</h2>
-                    <div class="gallery">
-                """
-                for i, img_path in enumerate(preview_images):
-                    relative_path = img_path.name
-                    json_path = config.output / f"{img_path.stem}.json"
-
-                    # Load metadata if exists
-                    metadata = {}
-                    if json_path.exists():
-                        try:
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                metadata = json.load(f)
-                        except json.JSONDecodeError as e:
-                            raise e
-                    else:
-                        raise FileNotFoundError(f"Metadata file not found: {json_path}")
-                            
-                    metadata_attr = f'data-metadata="{html.escape(json.dumps(metadata))}"' if metadata else ''
-
-                    if str(img_path).endswith('.mp4'):
-                        gallery_html += f"""
-                            <div class="gallery-item" onclick="openModal('{relative_path}', true, this, {i})" {metadata_attr}>
-                                <video>
-                                    <source src="{relative_path}" type="video/mp4">
-                                    Your browser does not support the video tag.
-                                </video>
-                            </div>
-                        """
-                    else:
-                        gallery_html += f"""
-                            <div class="gallery-item" onclick="openModal('{relative_path}', false, this, {i})" {metadata_attr}>
-                                <img src="{relative_path}" alt="Preview {i+1}">
-                            </div>
-                        """
-                gallery_html += "</div></div>"
-                
-            # CSS helpers
-            color_map = {
-                0: '#27ae60',
-                1: '#e93826'
+                json_entries: list[os.DirEntry[str]] = []
+                for _, _, stem in preview_images:
+                    json_name = f"{stem}.json"
+                    if json_name not in file_names:
+                        raise FileNotFoundError(f"Metadata file not found: {model.paths.output_dir / json_name}")
+                    json_entries.append(entries[json_name])
+                with ThreadPoolExecutor(max_workers=min(8, len(json_entries))) as executor:
+                    metadata_attrs = list(executor.map(partial(read_parsed, _parse_metadata_attr), json_entries))
+
+                for (_, relative_path, _), metadata_attr in zip(preview_images, metadata_attrs):
+                    previews.append({
+                        'path': relative_path,
+                        'is_video': relative_path.endswith('.mp4'),
+                        'metadata': metadata_attr,
+                    })
+
+            background_color = _NSFW_BG.get(model_data.nsfw, _NSFW_DEFAULT)
+
+            # Per-page values; the template escapes them all except the description, which is Civitai-provided HTML
+            commercial_uses = model_data.allowCommercialUse or []
+            if isinstance(commercial_uses, str):
+                commercial_uses = [commercial_uses]
+            context: dict[str, object] = {
+                'title': model_data.name,
+                'background_color': background_color,
+                'likes_width': get_rating_bar_width(stats),
+                'version_name': version_data.data.name,
+                'username': model_data.creator.username,
+                'previews': previews,
+                'model_type': model_data.type,
+                'model_id': model_data.id,
+                'version_id': version_data.data.id,
+                'nsfw': model_data.nsfw,
+                'commercial_uses': commercial_uses,
+                'description': model_data.description,
+                'tags': [get_tag_name(tag) for tag in model_data.tags],
+                **get_stat_counts(stats),
+                'created_at': version_data.createdAt,
+                'updated_at': version_data.updatedAt,
+                'base_model': version_data.data.baseModel,
+                'trained_words': version_data.data.trainedWords,
+                'filename': model.sanitized_name,
+                'hash_value': hash_data.get('hash_value', 'N/A'),
+                'file_size_mb': file_size_mb,
+                'version': VERSION,
+                'generated': generated_at or _GENERATED_AT,
+                'css_version': asset_version('model.css'),
+                'js_version': asset_version('model.js'),
             }
-            background_color = color_map.get(model_data.nsfw, '#95a5a6')
-
-            # HTML template
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{model_data.name}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            color: #2779af;
-            text-decoration: underline;
-        }}
-        code {{
-            font-family: 'Courier New', Courier, monospace;
-            font-size: 0.9rem;
-            background-color: #ffffff;
-            color: #c70066;
-            padding: 2px 6px;
-            border-radius: 4px;
-            border: 1px solid #e1e1e1;
-            white-space: pre-wrap;
-        }}
-        .container {{
-            background-color: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        .menu {{
-            font-size: 0.9rem;
-            font-weight: 600;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            font-size: 0.8rem;
-            color: #666;
-        }}
-        .section {{
-            margin-bottom: 20px;
-            padding-bottom: 20px;
-            border-bottom: 1px solid #eee;
-        }}
-        .section:last-child {{
-            border-bottom: none;
-        }}
-        h1 {{
-            color: #2c3e50;
-            margin-top: 0;
-            margin-bottom: 0;
-        }}
-        h2 {{
-            color: #34495e;
-            font-size: 1.4em;
-            margin-bottom: 15px;
-        }}
-        .label {{
-            font-weight: bold;
-            color: #7f8c8d;
-        }}
-        .value {{
-            margin-bottom: 10px;
-        }}
-        .description {{
-            white-space: pre-wrap;
-            background-color: #f8f9fa;
-            padding: 15px;
-            border-radius: 4px;
-            margin: 10px 0;
-            overflow: auto;
-        }}
-        .description img {{
-            max-width: 100%;
-        }}
-        .tags {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 4px;
-            margin-top: 10px;
-        }}
-        .tag {{
-            background-color: #3498db;
-            color: white;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 0.9em;
-        }}
-        .nsfw-level {{
-            display: inline-block;
-            padding: 5px 10px;
-            border-radius: 4px;
-            font-weight: bold;
-            background-color: {background_color};
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(165px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .stat-card {{
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 15px;
-            text-align: center;
-            //transition: transform 0.2s;
-        }}
-        //.stat-card:hover {{
-            //transform: translateY(-2px);
-            //box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        //}}
-        .stat-value {{
-            font-size: 1.8em;
-            font-weight: bold;
-            color: #2c3e50;
-            margin: 5px 0;
-        }}
-        .stat-label {{
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }}
-        .rating-bar {{
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            margin-top: 5px;
-        }}
-        .likes-ratio {{
-            flex-grow: 1;
-            height: 8px;
-            background-color: #e93826;
-            border-radius: 4px;
-            overflow: hidden;
-        }}
-        .likes-fill {{
-            height: 100%;
-            background-color: #27ae60;
-            width: {get_rating_bar_width(stats)}%;
-        }}
-        
-        /* New gallery styles */
-        .gallery {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .gallery-item {{
-            position: relative;
-            padding-bottom: 100%;
-            cursor: pointer;
-            border-radius: 8px;
-            overflow: hidden;
-            background-color: #f8f9fa;
-        }}
-        .gallery-item img {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-            transition: transform 0.3s ease;
-        }}
-        .gallery-item:hover img {{
-            transform: scale(1.05);
-        }}
-        .gallery-item video {{
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-            transition: transform 0.3s ease;
-        }}
-        .gallery-item:hover video {{
-            transform: scale(1.05);
-        }}
-        
-        /* Modal styles */
-        .modal {{
-            display: none;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background-color: rgba(0, 0, 0, 0.9);
-            z-index: 1000;
-            overflow: auto;
-        }}
-        .modal-wrapper {{
-            display: flex;
-            justify-content: center;
-            max-width: 90%;
-            max-height: 90%;
-            margin: 50px auto;
-            overflow: hidden;
-        }}
-        .modal-content {{
-            display: flex;
-            max-width: 90%;
-            margin: 50px auto;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-        }}
-        .modal-main {{
-            min-width: 0;
-            overflow: hidden;
-            border-radius: 8px;
-        }}
-        .modal-main img {{
-            display: block;
-        }}
-        .modal-main video {{
-            display: block;
-        }}
-        .modal-sidebar {{
-            width: 300px;
-            background: #f8f9fa;
-            padding: 20px;
-            overflow-y: auto;
-            max-height: 90vh;
-            border-radius: 8px;
-            margin-left: 20px;
-        }}
-        .metadata-section {{
-            margin-bottom: 15px;
-        }}
-        .metadata-label {{
-            font-weight: bold;
-            color: #666;
-            margin-bottom: 5px;
-        }}
-        .metadata-value {{
-            word-break: break-word;
-        }}
-        .resource-item {{
-            background: #cfcfcf;
-            border-radius: 8px;
-            padding: 8px;
-            font-size: 0.9rem;
-            margin-bottom: 5px;
-        }}
-        .modal-close {{
-            position: fixed;
-            top: 15px;
-            right: 35px;
-            color: #f1f1f1;
-            font-size: 40px;
-            font-weight: bold;
-            cursor: pointer;
-        }}
-        .navigation-hint {{
-            position: fixed;
-            bottom: 20px;
-            left: 50%;
-            transform: translateX(-50%);
-            color: #fff;
-            background: rgba(0, 0, 0, 0.5);
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 14px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="menu"><a href="../index.html">Civitai Data Manager</a></div>
-            <h1>{model_data.name}</h1>
-            <div><em>{version_data.data.name}</em></div>
-            <div>by <strong>
-                {'<a href="https://civitai.com/user/' + model_data.creator.username + '" target="_blank">' + model_data.creator.username + '</a>' if model_data.creator.username != 'Unknown Creator' else model_data.creator.username}
-            </strong></div>
-        </div>
-
-        {gallery_html}
-
-        <div class="section">
-            <h2>Model Information</h2>
-            <div class="label">Type:</div>
-            <div class="value">{model_data.type}</div>
-
-            <div class="label">Model ID:</div>
-            <div class="value">{model_data.id}</div>
-
-            <div class="label">Version ID:</div>
-            <div class="value">{version_data.data.id}</div>
-            
-            <!-- <div class="label">NSFW:</div>
-            <div class="value">
-                <span class="nsfw-level">{model_data.nsfw}</span>
-            </div> -->
-            
-            <!-- <div class="label">Allow Commercial Use:</div>
-            <div class="value">
-                {' '.join(f'<span class="tag">{use}</span>' for use in (model_data.allowCommercialUse or []))}
-            </div> -->
-            
-            <div class="label">Description:</div>
-            <div class="description">{model_data.description}</div>
-            
-            <div class="label">Tags:</div>
-            <div class="tags">
-                {' '.join(f'<span class="tag">{tag}</span>' for tag in model_data.tags)}
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>Model Statistics</h2>
-            <div class="stats-grid">
-                <div class="stat-card">
-                    <div class="stat-label">Downloads</div>
-                    <div class="stat-value">{stats.downloadCount if stats else None:,}</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Favorites</div>
-                    <div class="stat-value">{stats.favoriteCount if stats else None:,}</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Comments</div>
-                    <div class="stat-value">{stats.commentCount if stats else None:,}</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-label">Tips Received</div>
-                    <div class="stat-value">{stats.tippedAmountCount if stats else None:,}</div>
-                </div>
-            </div>
-            
-            <div style="margin-top: 20px;">
-                <div class="label">Rating Distribution</div>
-                <div class="rating-bar">
-                    <span>👍 {stats.thumbsUpCount if stats else None:,}</span>
-                    <div class="likes-ratio">
-                        <div class="likes-fill"></div>
-                    </div>
-                    <span>👎 {stats.thumbsDownCount if stats else None:,}</span>
-                </div>
-            </div>
-        </div>
-
-        <div class="section">
-            <h2>Version Information</h2>
-            <div class="label">Created At:</div>
-            <div class="value">{version_data.createdAt}</div>
-            
-            <div class="label">Updated At:</div>
-            <div class="value">{version_data.updatedAt}</div>
-            
-            <div class="label">Base Model:</div>
-            <div class="value">{version_data.data.baseModel}</div>
-
-            {'<div class="label">Trained Words:</div><div class="tags"> ' + ' '.join(f'<span class="tag">{word}</span>' for word in version_data.data.trainedWords) + '</div>' if version_data.data.trainedWords else ''}
-        </div>
-
-        <div class="section">
-            <h2>File Information</h2>
-            <div class="label">Filename:</div>
-            <div class="value" style="word-break: break-all;">{model.sanitized_name}</div>
-
-            <div class="label">SHA256 Hash:</div>
-            <div class="value" style="word-break: break-all;">{hash_data.get('hash_value', 'N/A')}</div>
-
-            <div class="label">File size:</div>
-            <div class="value" style="word-break: break-all;">{round(fileSizeMB, 2)} MB</div>
-        </div>
-
-        <div class="section">
-            <h2>Links</h2>
-            <div class="value">
-                <a href="https://civitai.com/models/{model_data.id}" target="_blank">Civitai Model Page</a>
-                <br />
-                <a href="https://civitai.com/api/download/models/{model_data.id}" target="_blank">Civitai Download URL</a>
-            </div>
-        </div>
-    </div>
-    
-    <div class="footer">
-        Civitai Data Manager. Version {VERSION}. <a href="https://github.com/jeremysltn/civitai-data-manager">GitHub</a>
-        <br />
-        Generated: {datetime.now().isoformat()}
-    </div>
-
-    <!-- Modal for full-size media -->
-    <div id="imageModal" class="modal">
-        <span class="modal-close">&times;</span>
-        <div class="modal-wrapper">
-            <div class="modal-main">
-                <img id="modalImage" style="display: none;">
-                <video id="modalVideo" controls style="display: none;">
-                    <source src="" type="video/mp4">
-                    Your browser does not support the video tag.
-                </video>
-            </div>
-            <div class="modal-sidebar">
-                <div id="modalMetadata"></div>
-            </div>
-        </div>
-        <div class="navigation-hint">Use ← → arrow keys to navigate</div>
-    </div>
-
-    <script>
-        function openModal(mediaPath, isVideo, element, index) {{
-            const modal = document.getElementById('imageModal');
-            const modalImg = document.getElementById('modalImage');
-            const modalVideo = document.getElementById('modalVideo');
-            const metadataDiv = document.getElementById('modalMetadata');
-            currentImageIndex = index;
-            
-            modal.style.display = "block";
-            
-            // Get metadata from clicked element
-            const metadata = element.dataset.metadata;
-            
-            if (isVideo) {{
-                modalImg.style.display = "none";
-                modalVideo.style.display = "block";
-                modalVideo.src = mediaPath;
-                modalVideo.play();
-            }} else {{
-                modalImg.style.display = "block";
-                modalVideo.style.display = "none";
-                modalImg.src = mediaPath;
-            }}
-            
-            // Display metadata if available
-            if (metadata) {{
-                const data = JSON.parse(metadata);
-                let metadataHtml = '';
-
-                if (data.hasMeta === false) {{
-                    metadataHtml += `
-                        <p>No metadata available</p>
-                    `;
-                }}
-                
-                // Add generation metadata if available
-                if (data.meta) {{
-                    const meta = data.meta;
-                    
-                    if (meta.prompt) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Prompt</div>
-                                <div class="metadata-value" style="white-space: pre-wrap;">${{meta.prompt}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.cfgScale) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">CFG Scale/Guidance</div>
-                                <div class="metadata-value">${{meta.cfgScale}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.steps) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Steps</div>
-                                <div class="metadata-value">${{meta.steps}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.denoise) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Denoise</div>
-                                <div class="metadata-value">${{meta.denoise}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.seed) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Seed</div>
-                                <div class="metadata-value">${{meta.seed}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.sampler) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Sampler</div>
-                                <div class="metadata-value">${{meta.sampler}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta['Schedule type']) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Schedule Type</div>
-                                <div class="metadata-value">${{meta['Schedule type']}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta['Distilled CFG Scale']) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Distilled CFG Scale</div>
-                                <div class="metadata-value">${{meta['Distilled CFG Scale']}}</div>
-                            </div>
-                        `;
-                    }}
-                    
-                    if (meta.Model) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Model</div>
-                                <div class="metadata-value">${{meta.Model}}</div>
-                            </div>
-                        `;
-                    }}
-
-                    if (meta['resources'] && meta['resources'].length > 0) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Resources</div>
-                                <div class="metadata-value">
-                                    ${{meta['resources'].map(resource => `
-                                        <div class="resource-item">
-                                            <div class="resource-name">${{resource.name}} (${{resource.type}})</div>
-                                            ${{resource.weight ? `<div class="resource-weight">weight: ${{resource.weight}}</div>` : ''}}
-                                        </div>
-                                    `).join('')}}
-                                </div>
-                            </div>
-                        `;
-                    }}
-
-                    if (meta['additionalResources'] && meta['additionalResources'].length > 0) {{
-                        metadataHtml += `
-                            <div class="metadata-section">
-                                <div class="metadata-label">Additional Resources</div>
-                                <div class="metadata-value">
-                                    ${{meta['additionalResources'].map(resource => `
-                                        <div class="resource-item">
-                                            <div class="resource-name">${{resource.name}} (${{resource.type}})</div>
-                                            ${{resource.strength ? `<div class="resource-weight">strength: ${{resource.strength}}</div>` : ''}}
-                                        </div>
-                                    `).join('')}}
-                                </div>
-                            </div>
-                        `;
-                    }}
-                }}
-                
-                metadataDiv.innerHTML = metadataHtml;
-            }} else {{
-                metadataDiv.innerHTML = '<p>No metadata available</p>';
-            }}
-        }}
-
-        function closeModal() {{
-            const modal = document.getElementById('imageModal');
-            const modalVideo = document.getElementById('modalVideo');
-            modal.style.display = "none";
-            modalVideo.pause();
-            modalVideo.currentTime = 0;
-        }}
-
-        // Close modal
-        document.addEventListener('DOMContentLoaded', function() {{
-            // Close only when clicking the X button
-            document.querySelector('.modal-close').addEventListener('click', function() {{
-                closeModal();
-            }});
-
-            // Close with Escape key
-            document.addEventListener('keydown', function(event) {{
-                if (event.key === "Escape") {{
-                    closeModal();
-                }}
-            }});
-        }});
-
-        // Track current image index and all gallery items
-        let currentImageIndex = 0;
-        const galleryItems = document.querySelectorAll('.gallery-item');
-
-        // Initialize gallery items array when DOM loads
-        document.addEventListener('DOMContentLoaded', function() {{
-            // Add keyboard navigation
-            document.addEventListener('keydown', function(event) {{
-                const modal = document.getElementById('imageModal');
-                // Only handle keyboard navigation when modal is open
-                if (modal.style.display === "block") {{
-                    switch(event.key) {{
-                        case "ArrowLeft":
-                            navigateImage(-1);
-                            break;
-                        case "ArrowRight":
-                            navigateImage(1);
-                            break;
-                        case "Escape":
-                            closeModal();
-                            break;
-                    }}
-                }}
-            }});
-        }});
-
-        // Function to navigate between images
-        function navigateImage(direction) {{
-            const newIndex = currentImageIndex + direction;
-            
-            // Check if new index is valid
-            if (newIndex >= 0 && newIndex < galleryItems.length) {{
-                currentImageIndex = newIndex;
-                const nextItem = galleryItems[newIndex];
-                
-                // Get the media source directly from the gallery item's onclick attribute
-                const onclickAttr = nextItem.getAttribute('onclick');
-                const mediaPath = onclickAttr.split("'")[1];  // Extract path from onclick="openModal('path',..."
-                const isVideo = mediaPath.endsWith('.mp4');
-                
-                // Use existing openModal function to handle the display and metadata
-                openModal(mediaPath, isVideo, nextItem, newIndex);
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
-            # Write HTML file
-            with open(model.paths.html, 'w', encoding='utf-8') as f:
-                _ = f.write(html_content)
+            # Stream the rendered chunks into a temporary file, then swap it into place, so a failed
+            # write never leaves a truncated page that the freshness check would take as up to date
+            tmp_path = model.paths.html.with_suffix('.html.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                    f.writelines(_PAGE_TEMPLATE.generate(context))
+                os.replace(tmp_path, model.paths.html)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
                 
             print(f"HTML summary generated: {model.paths.html}")
-            return True
+            return 'generated'
                 
-        except json.JSONDecodeError as e:
+        # Malformed JSON and pydantic validation errors are both ValueErrors
+        except ValueError as e:
             raise Exception(f"Error parsing JSON data: {str(e)}") from e
-            return False
             
-    except Exception as e:
+    except (OSError, ValueError) as e:
         raise Exception(f"Error generating HTML summary: {str(e)}") from e
-        return False
+
+
+def _generate_html_summary_task(args: tuple[Config, ModelData, str, str]) -> PageResult:
+    """Worker entry point for generate_html_summaries; reports a failed page instead of aborting the batch"""
+    config, model, VERSION, generated_at = args
+    try:
+        return generate_html_summary(config, model, VERSION, generated_at, copy_assets=False)
+    except Exception as e:
+        print(f"Error: {model.safetensors.name}: {e}")
+        return 'failed'
+
+
+def generate_html_summaries(config: Config, models: Iterable[ModelData], VERSION: str, workers: int | None = None) -> list[PageResult]:
+    """
+    Generate the HTML summaries of many models in parallel, one worker process per core
+
+    Each page is independent and its rendering is CPU-bound, so separate
+    processes (unlike threads) render them side by side.
+
+    Args:
+        config (Config): Configuration
+        models (Iterable[ModelData]): Models to generate pages for
+        VERSION (str): Version of the script
+        workers (int | None): Number of worker processes, defaults to the CPU count (never more than there are pages)
+
+    Returns:
+        list[PageResult]: Outcome of each model's page, in the order given
+    """
+    # The parent's timestamp is passed along, as spawned workers would each take their own at import
+    tasks = [(config, model, VERSION, _GENERATED_AT) for model in models]
+    if not tasks:
+        return []
+    # Copied once here rather than by every worker at the same time
+    _ = copy_static_assets(config.output, MODEL_PAGE_ASSETS)
+    max_workers = min(workers or os.cpu_count() or 1, len(tasks))
+    # Hand tasks out a few at a time to cut inter-process round trips, while still spreading small batches over every worker
+    chunksize = max(1, min(8, len(tasks) // max_workers))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_generate_html_summary_task, tasks, chunksize=chunksize))
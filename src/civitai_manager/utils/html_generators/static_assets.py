@@ -0,0 +1,50 @@
+from functools import lru_cache
+from pathlib import Path
+import hashlib
+import shutil
+
+ASSETS_DIR = Path(__file__).with_name('assets')
+OUTPUT_ASSETS_DIR_NAME = 'assets'
+
+@lru_cache(maxsize=None)
+def asset_version(name: str) -> str:
+    """
+    Short content hash of a packaged asset, appended to its URL so browsers
+    keep it cached until the file actually changes
+
+    Args:
+        name (str): Asset filename
+
+    Returns:
+        str: Hex digest of the asset's contents
+    """
+    return hashlib.blake2b((ASSETS_DIR / name).read_bytes(), digest_size=8).hexdigest()
+
+def copy_static_assets(output_dir: Path, names: tuple[str, ...]) -> Path:
+    """
+    Copy shared CSS/JS files shipped with the package into the output directory
+
+    Files whose size and modification time already match are left alone, so
+    repeated runs do not rewrite them.
+
+    Args:
+        output_dir (Path): Base output directory
+        names (tuple[str, ...]): Asset filenames to copy
+
+    Returns:
+        Path: Directory the assets were copied to
+    """
+    dest_dir = output_dir / OUTPUT_ASSETS_DIR_NAME
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    for name in names:
+        src = ASSETS_DIR / name
+        dest = dest_dir / name
+        src_stat = src.stat()
+        if dest.exists():
+            dest_stat = dest.stat()
+            if dest_stat.st_size == src_stat.st_size and dest_stat.st_mtime_ns == src_stat.st_mtime_ns:
+                continue
+        _ = shutil.copy2(src, dest)
+
+    return dest_dir
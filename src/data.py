@@ -1,10 +1,9 @@
-from collections.abc import Iterable
 from datetime import datetime
-from enum import StrEnum
 from functools import cached_property
 from pathlib import Path
-from typing import TypedDict
+from typing import Literal, TypedDict
 
+from attrs import define
 import pydantic
 
 from civitai import Model
@@ -13,9 +12,29 @@ from civitai_manager.utils.string_utils import sanitize_filename
 
 MISSING_FILES_NAME = "missing_from_civitai.txt"
 
-class HashType(StrEnum):
-    SHA256 = "SHA256"
 
+def read_missing_models(missing_file: Path) -> set[str]:
+    """
+    Read the filenames listed in a missing_from_civitai.txt file
+
+    Args:
+        missing_file (Path): Path to the file
+
+    Returns:
+        set[str]: Listed safetensors filenames, empty if the file does not exist
+    """
+    if not missing_file.exists():
+        return set()
+    # The filename is the last ' | '-separated field of each non-comment line
+    return {
+        line.strip().rsplit(' | ', 1)[-1]
+        for line in missing_file.read_text(encoding='utf-8').splitlines()
+        if line.strip() and not line.startswith('#')
+    }
+
+# Hash algorithms recorded in hash files; a literal validates as a plain string comparison
+type HashType = Literal["SHA256"]
+HASH_SHA256: HashType = "SHA256"
 
 HashTypeTA = pydantic.TypeAdapter(HashType)
 
@@ -28,8 +47,10 @@ class HashData(TypedDict):
 
 HashDataTA = pydantic.TypeAdapter(HashData)
 
-class ModelPaths(pydantic.BaseModel):
-    safetensors: pydantic.FilePath
+# Derived from an already validated ModelData, so a plain slotted class with no validation pass
+@define(frozen=True)
+class ModelPaths:
+    safetensors: Path
     output_dir: Path
     base_dir: Path
     info: Path
@@ -57,31 +78,52 @@ class ModelData(pydantic.BaseModel):
     base_dir: pydantic.DirectoryPath
     safetensors: pydantic.FilePath
 
+    @classmethod
+    def from_trusted(cls, base_dir: Path, safetensors: Path) -> "ModelData":
+        """
+        Build a ModelData without the existence checks on its paths
+
+        For callers that just took safetensors from a directory listing and
+        base_dir from the validated config, where the two stat calls of normal
+        validation would only repeat what is already known.
+
+        Args:
+            base_dir (Path): Existing base output directory
+            safetensors (Path): Existing safetensors file
+
+        Returns:
+            ModelData: Unvalidated model data
+        """
+        return cls.model_construct(base_dir=base_dir, safetensors=safetensors)
+
     @cached_property
     def sanitized_name(self) -> str:
         return sanitize_filename(self.safetensors.stem)
 
     @cached_property
     def model(self) -> Model:
-        return Model.model_validate_json(self.paths.info.read_text())
+        return Model.model_validate_json(self.paths.info.read_bytes())
 
     # model: Model
 
     @cached_property
     def paths(self) -> ModelPaths:
-        output_dir = self.base_dir / Path(self.sanitized_name)
+        name = self.sanitized_name
+        output_dir = self.base_dir / name
         p = ModelPaths(
             base_dir=self.base_dir,
             output_dir=output_dir,
-            info=output_dir / Path(f"{self.sanitized_name}{INFO_SUFFIX}"),
-            version=output_dir / Path(f"{self.sanitized_name}{MODEL_VERSION_SUFFIX}"),
-            hash=output_dir / Path(f"{self.sanitized_name}{HASH_SUFFIX}"),
+            info=output_dir / f"{name}{INFO_SUFFIX}",
+            version=output_dir / f"{name}{MODEL_VERSION_SUFFIX}",
+            hash=output_dir / f"{name}{HASH_SUFFIX}",
             safetensors=self.safetensors,
-            html=output_dir / Path(f"{self.sanitized_name}{HTML_SUFFIX}"),
+            html=output_dir / f"{name}{HTML_SUFFIX}",
         )
 
         return p
 
     @cached_property
-    def required_paths(self) -> Iterable[Path]:
-        return [p for p in filter(lambda p: p.stem.endswith(".json"), self.paths.as_dict().values())]
+    def required_paths(self) -> tuple[Path, ...]:
+        # The JSON files of the model, known from the ModelPaths fields rather than filtered out of them
+        paths = self.paths
+        return (paths.info, paths.version, paths.hash)
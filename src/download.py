@@ -5,6 +5,7 @@ from pydantic import DirectoryPath
 import pydantic
 from pathlib import Path
 import asyncio
+import os
 from attrs import define
 import aiohttp
 
@@ -12,18 +13,29 @@ from civitai_manager.utils.config import Config
 from data import ModelData
 
 
-@define
+# Ordered by url and dest, which breaks ties between queue entries of equal priority
+@define(order=True)
 class DownloadTask:
     url: str
     dest: Path
 
-    config: Config
+    config: Config = attrs.field(order=False)
 
-    model: ModelData | None = attrs.field(default=None)
+    model: ModelData | None = attrs.field(default=None, order=False)
 
 
 DEFAULT_PRIORITY = 10
 
+DirectoryPathTA = pydantic.TypeAdapter(DirectoryPath)
+
+DOWNLOAD_HEADERS: dict[str, str] = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.142.86 Safari/537.36'}
+DOWNLOAD_LIMIT_PER_HOST = 64
+DEFAULT_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+DOWNLOAD_RETRIES = 3
+# No overall limit, model files can take far longer than aiohttp's default 5 minutes; only a stalled read times out
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_read=60)
+
 class AbstractDownloadQueue:
     @abstractmethod
     async def add(self, task: DownloadTask, priority: int | None = None) -> None:
@@ -47,10 +59,13 @@ class AbstractDownloadQueue:
 
 @define
 class DownloadQueue(AbstractDownloadQueue):
-    dest_dir: DirectoryPath = attrs.field(converter=pydantic.TypeAdapter(DirectoryPath).validate_python, factory=Path)
+    dest_dir: DirectoryPath = attrs.field(converter=DirectoryPathTA.validate_python, factory=Path)
     config: Config = attrs.field(factory=Config)
     input_queue: asyncio.PriorityQueue[tuple[int, DownloadTask]] = attrs.field(factory=asyncio.PriorityQueue[tuple[int, DownloadTask]])
     default_priority: int = attrs.field(default=DEFAULT_PRIORITY)
+    workers: int = attrs.field(default=DEFAULT_WORKERS)
+    failed: list[tuple[DownloadTask, aiohttp.ClientError | OSError]] = attrs.field(factory=list, init=False)
+    _claimed: set[Path] = attrs.field(factory=set, init=False)
 
     @override
     async def add(self, task: DownloadTask, priority: int | None = None):
@@ -66,11 +81,68 @@ class DownloadQueue(AbstractDownloadQueue):
 
     @override
     async def start(self):
-        while not self.input_queue.empty():
-            _priority, task = await self.get()
+        # One session for the whole drain, so downloads from the same host reuse pooled connections,
+        # and several workers draining the queue so downloads overlap instead of running one by one
+        self.failed.clear()
+        connector = aiohttp.TCPConnector(limit_per_host=DOWNLOAD_LIMIT_PER_HOST)
+        async with aiohttp.ClientSession(headers=DOWNLOAD_HEADERS, connector=connector, timeout=DOWNLOAD_TIMEOUT) as session:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(self.workers, self.input_queue.qsize())):
+                    _ = tg.create_task(self._worker(session))
+        # Failed downloads do not stop the others; they are reported together once the queue is drained
+        if self.failed:
+            raise ExceptionGroup(f"{len(self.failed)} download(s) failed", [error for _task, error in self.failed])
 
-            headers: dict[str, str] = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.142.86 Safari/537.36'}
+    @override
+    async def wait(self):
+        await self.input_queue.join()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(task.url, headers=headers) as response:
-                    a = await response.text(encoding="utf-8")
+    async def _worker(self, session: aiohttp.ClientSession):
+        # Nothing is awaited between the emptiness check and taking the task, so workers cannot race for the last one
+        while not self.input_queue.empty():
+            _priority, task = self.input_queue.get_nowait()
+            try:
+                await self._download(session, task)
+            except (aiohttp.ClientError, OSError) as e:
+                print(f"Download failed: {task.url}: {e}")
+                self.failed.append((task, e))
+            finally:
+                self.input_queue.task_done()
+
+    def _claim_dest(self, dest_dir: Path, name: str) -> Path:
+        # Several tasks may resolve to the same basename; number the later ones so they never share a file.
+        # Nothing is awaited between the check and the claim, so concurrent workers cannot both take a name
+        stem, ext = os.path.splitext(name)
+        dest = dest_dir / name
+        n = 1
+        while dest in self._claimed:
+            dest = dest_dir / f"{stem}_{n}{ext}"
+            n += 1
+        self._claimed.add(dest)
+        return dest
+
+    async def _download(self, session: aiohttp.ClientSession, task: DownloadTask):
+        # Stream the body to disk chunk by chunk, so memory use does not grow with the file size;
+        # connection errors, including a body cut off mid-transfer, are retried with exponential back-off
+        dest: Path | None = None
+        for attempt in range(DOWNLOAD_RETRIES):
+            try:
+                async with session.get(task.url) as response:
+                    response.raise_for_status()
+                    if dest is None:
+                        dest = self._claim_dest(task.dest, response.url.name or response.url.host or 'download') if task.dest.is_dir() else task.dest
+                    # Written under a .part name and moved into place when complete, so an interrupted download never leaves a truncated file behind
+                    part = dest.with_suffix(dest.suffix + '.part')
+                    try:
+                        with open(part, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                _ = await asyncio.to_thread(f.write, chunk)
+                        os.replace(part, dest)
+                    except BaseException:
+                        part.unlink(missing_ok=True)
+                        raise
+                return
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError):
+                if attempt == DOWNLOAD_RETRIES - 1:
+                    raise
+                await asyncio.sleep(2.0 ** attempt)
@@ -1,9 +1,16 @@
 import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from enum import StrEnum
-import json
 import aiohttp
 import pydantic
 
+SWARMUI_URL = "http://localhost:7801"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies, serialized straight to bytes by pydantic's Rust JSON core
+RequestBodyTA = pydantic.TypeAdapter(dict[str, object])
+
 class Session(pydantic.BaseModel):
     session_id: str
     user_id: str
@@ -53,64 +60,76 @@ class ListModelsOptions(pydantic.BaseModel):
     path: str = pydantic.Field()
     subtype: ModelSubtype = pydantic.Field()
 
+# Dumped once, as list_models sends these unless given other options
+DEFAULT_LIST_MODELS_OPTIONS = ListModelsOptions(
+    subtype=ModelSubtype.LORA,
+    depth=1,
+    path="/",
+).model_dump(exclude_unset=True)
+
 class DescribeModelResponse(pydantic.BaseModel):
     model: ModelData
 
-async def get_new_session():
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "http://localhost:7801/API/GetNewSession",
-            headers={"Content-Type": "application/json"},
+@asynccontextmanager
+async def _http_client(client: aiohttp.ClientSession | None) -> AsyncGenerator[aiohttp.ClientSession]:
+    """Use the caller's HTTP session if given, so its pooled connections are reused, else a temporary one"""
+    if client is not None:
+        yield client
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+async def get_new_session(client: aiohttp.ClientSession | None = None):
+    async with _http_client(client) as http:
+        async with http.post(
+            f"{SWARMUI_URL}/API/GetNewSession",
+            headers=JSON_HEADERS,
             data="{}",
         ) as response:
-            return Session.model_validate(await response.json())
+            return Session.model_validate_json(await response.read())
 
-async def list_models(session_id_or_session: str | Session, opts: ListModelsOptions | None = None):
+async def list_models(session_id_or_session: str | Session, opts: ListModelsOptions | None = None, client: aiohttp.ClientSession | None = None):
     if isinstance(session_id_or_session, Session):
         session_id = session_id_or_session.session_id
     else:
         session_id = session_id_or_session
 
-    opts = opts or ListModelsOptions(
-        subtype=ModelSubtype.LORA,
-        depth=1,
-        path="/",
-    )
-
-
-    data = {"session_id": session_id, **opts.model_dump(exclude_unset=True)}
+    options = DEFAULT_LIST_MODELS_OPTIONS if opts is None else opts.model_dump(exclude_unset=True)
+    data: dict[str, object] = {"session_id": session_id, **options}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "http://localhost:7801/API/ListModels",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(data),
+    async with _http_client(client) as http:
+        async with http.post(
+            f"{SWARMUI_URL}/API/ListModels",
+            headers=JSON_HEADERS,
+            data=RequestBodyTA.dump_json(data),
         ) as response:
-            return ListModelsData.model_validate(await response.json())
+            return ListModelsData.model_validate_json(await response.read())
 
-async def describe_model(session_id_or_session: str | Session, subtype: ModelSubtype, model_name: str):
+async def describe_model(session_id_or_session: str | Session, subtype: ModelSubtype, model_name: str, client: aiohttp.ClientSession | None = None):
     if isinstance(session_id_or_session, Session):
         session_id = session_id_or_session.session_id
     else:
         session_id = session_id_or_session
 
-    data = {"session_id": session_id, "modelName": model_name, "subtype": subtype}
+    data: dict[str, object] = {"session_id": session_id, "modelName": model_name, "subtype": subtype}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            "http://localhost:7801/API/DescribeModel",
-            headers={"Content-Type": "application/json"},
-            data=json.dumps(data),
+    async with _http_client(client) as http:
+        async with http.post(
+            f"{SWARMUI_URL}/API/DescribeModel",
+            headers=JSON_HEADERS,
+            data=RequestBodyTA.dump_json(data),
         ) as response:
-            return DescribeModelResponse.model_validate(await response.json())
+            return DescribeModelResponse.model_validate_json(await response.read())
 
 
 async def main():
-    session = Session.model_validate(await get_new_session())
-    models = await list_models(session)
-    if models.files:
-        m = describe_model(session, ModelSubtype.LORA, models.files[0].name)
-        print(m)
+    # One HTTP session for every call, keeping the connection to SwarmUI alive between them
+    async with aiohttp.ClientSession() as client:
+        session = await get_new_session(client)
+        models = await list_models(session, client=client)
+        if models.files:
+            m = await describe_model(session, ModelSubtype.LORA, models.files[0].name, client=client)
+            print(m)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,23 @@
+from collections.abc import Callable
+import json
+# The package has to be initialized before data, which imports back into it
+import civitai_manager
+from data import ModelData
+import pytest
+
+type WriteModelFiles = Callable[..., None]
+
+def _write_model_files(model: ModelData, with_hash: bool = True, **info: object):
+    with open("test_data/ModelResponseData.json", "r") as f:
+        data = json.loads(f.read())
+    data.update(info)
+    model.paths.output_dir.mkdir(parents=True)
+    _ = model.paths.info.write_text(json.dumps(data))
+    _ = model.paths.version.write_text(json.dumps({"data": data["modelVersions"][0], "createdAt": "2025-01-01T00:00:00+00:00", "updatedAt": "2025-01-01T00:00:00+00:00"}))
+    if with_hash:
+        _ = model.paths.hash.write_text(json.dumps({"hash_type": "SHA256", "hash_value": "ab" * 32, "filename": model.safetensors.name, "timestamp": "2025-01-01T00:00:00"}))
+
+@pytest.fixture
+def write_model_files() -> WriteModelFiles:
+    """Write a model's info, version and (optionally) hash sidecars from the sample response; keyword arguments override info fields"""
+    return _write_model_files
@@ -0,0 +1,32 @@
+import json
+import re
+from pathlib import Path
+from civitai_manager.utils.config import Config
+from civitai_manager.utils.html_generators.browser_page import generate_global_summary
+from data import ModelData
+from conftest import WriteModelFiles
+
+def test_search_index_is_inert(tmp_path: Path, write_model_files: WriteModelFiles):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    config = Config(all=str(models_dir), output=tmp_path / "out")
+    config.output.mkdir()
+
+    _ = (models_dir / "evil.safetensors").write_bytes(b"\0")
+    model = ModelData(base_dir=config.output, safetensors=models_dir / "evil.safetensors")
+    write_model_files(model, name="</script><b>", tags=["</SCRIPT><script>alert(1)</script>"])
+
+    generate_global_summary(config, "test")
+
+    page = (config.output / "index.html").read_text(encoding="utf-8")
+    match = re.search(r'<script type="application/json" id="model-index">(.*?)</script>', page, re.DOTALL)
+    assert match is not None
+    search_index_json = match.group(1)
+    # No '<' can open a tag, so the first '</script>' found is the block's real end
+    assert "<" not in search_index_json
+    assert json.loads(search_index_json) == [{
+        "name": "</script><b>",
+        "filename": "evil",
+        "tags": ["</script><script>alert(1)</script>"],
+    }]
+    assert "<b>" not in page
@@ -1,14 +1,15 @@
+from pathlib import Path
 from pydantic import TypeAdapter
 import civitai
 import json
 
 def test_ModelResponseData():
-    with open("test_data/ModelResponseData.json", "r") as f:
-        data = json.loads(f.read())
-        _ = civitai.Creator.model_validate_json(json.dumps(data["creator"]))
-        _ = TypeAdapter(list[civitai.Tag]).validate_json(json.dumps(data["tags"]))
-        _ = civitai.Stats.model_validate_json(json.dumps(data["stats"]))
+    raw = Path("test_data/ModelResponseData.json").read_bytes()
+    _ = civitai.ModelResponseData.model_validate_json(raw)
 
-        _ = civitai.ModelVersion.model_validate_json(json.dumps(data["modelVersions"][0]))
+    data = json.loads(raw)
+    _ = civitai.Creator.model_validate(data["creator"])
+    _ = TypeAdapter(list[civitai.Tag]).validate_python(data["tags"])
+    _ = civitai.Stats.model_validate(data["stats"])
 
-        _ = civitai.ModelResponseData.model_validate_json(json.dumps(data))
+    _ = civitai.ModelVersion.model_validate(data["modelVersions"][0])
@@ -0,0 +1,29 @@
+from pathlib import Path
+from civitai_manager.utils.config import Config
+from civitai_manager.core.metadata_manager import process_directory
+from data import ModelData
+from conftest import WriteModelFiles
+import pytest
+
+def test_required_paths(tmp_path: Path):
+    _ = (tmp_path / "foo.safetensors").write_bytes(b"\0")
+    model = ModelData(base_dir=tmp_path, safetensors=tmp_path / "foo.safetensors")
+    assert model.required_paths == (model.paths.info, model.paths.version, model.paths.hash)
+
+@pytest.mark.asyncio
+async def test_onlyhtml_skips_model_without_hash(tmp_path: Path, write_model_files: WriteModelFiles):
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    config = Config(all=str(models_dir), output=tmp_path / "out", onlyhtml=True)
+    config.output.mkdir()
+
+    for name in ("complete", "no_hash"):
+        _ = (models_dir / f"{name}.safetensors").write_bytes(b"\0")
+    complete = ModelData(base_dir=config.output, safetensors=models_dir / "complete.safetensors")
+    no_hash = ModelData(base_dir=config.output, safetensors=models_dir / "no_hash.safetensors")
+    write_model_files(complete)
+    write_model_files(no_hash, with_hash=False)
+
+    assert await process_directory(config, models_dir)
+    assert complete.paths.html.exists()
+    assert not no_hash.paths.html.exists()
@@ -0,0 +1,28 @@
+import re
+from civitai_manager.utils.string_utils import _UNSAFE_CHARS, sanitize_filename
+import pytest
+
+def regex_sanitize_filename(filename: str) -> str:
+    return re.sub(r'_+', '_', _UNSAFE_CHARS.sub('_', filename).strip('._'))
+
+@pytest.mark.parametrize("filename", [
+    "My Model v1.0",
+    "a[b](c){d}'e'\"f\"",
+    "x<y>:z/w\\v|u?t*s",
+    "tab\tnew\nline",
+    "keep-dashes-and_underscores",
+    "café モデル",
+    "Ünïcödé_名前 (v2)",
+    "ß-ẞ·x",
+    "a__b___c____d",
+    "a _ b",
+    "__leading",
+    "trailing__",
+    "..dots..",
+    "._._mixed._._",
+    "-dash-",
+    "__",
+    "",
+])
+def test_sanitize_filename_matches_regex(filename: str):
+    assert sanitize_filename(filename) == regex_sanitize_filename(filename)